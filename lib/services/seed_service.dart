@@ -74,12 +74,42 @@ class SeedService {
       } else {
         final topic = Topic.fromJson(jsonMap['topic'] as Map<String, dynamic>);
         topics.add(topic);
-        final quizList = (jsonMap['quizzes'] as List<dynamic>)
-            .map((raw) => Quiz.fromJson(raw as Map<String, dynamic>, topic.id));
+        final questionTable = _questionTable(jsonMap);
+        final quizList = (jsonMap['quizzes'] as List<dynamic>).map((raw) =>
+            Quiz.fromJson(
+              _resolveQuestionRefs(raw as Map<String, dynamic>, questionTable),
+              topic.id,
+            ));
         quizzes.addAll(quizList);
       }
     }
 
     return _SeedBundle(topics: topics, quizzes: quizzes);
   }
+
+  /// Banks written with `--layout refs` store each question once in a
+  /// top-level `questions` table and list them per quiz via `questionIds`.
+  Map<String, dynamic>? _questionTable(Map<String, dynamic> jsonMap) {
+    final entries = jsonMap['questions'];
+    if (entries is! List<dynamic>) return null;
+    return {
+      for (final raw in entries)
+        (raw as Map<String, dynamic>)['id'] as String: raw,
+    };
+  }
+
+  Map<String, dynamic> _resolveQuestionRefs(
+    Map<String, dynamic> quizJson,
+    Map<String, dynamic>? questionTable,
+  ) {
+    final ids = quizJson['questionIds'];
+    if (questionTable == null || ids is! List<dynamic>) return quizJson;
+    return {
+      ...quizJson,
+      'questions': [
+        for (final id in ids)
+          if (questionTable.containsKey(id)) questionTable[id as String],
+      ],
+    };
+  }
 }
@@ -1,9 +1,15 @@
-import json
-import sys
+"""Add the hand-written questions below to nclex_practice_bank.json.
 
-# Load existing JSON
-with open('assets/data/nclex_practice_bank.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
+The questions go through ``bulk_ingest``: target quizzes are looked up by id,
+questions already in the bank are skipped, and the bank is written once,
+atomically. Run from the repository root.
+"""
+
+from pathlib import Path
+
+from bulk_ingest import QuizIndex, ingest_rows, report
+
+BANK_PATH = Path('assets/data/nclex_practice_bank.json')
 
 # Additional questions for Maternal-Newborn (add 10 more)
 maternal_questions = [
@@ -79,11 +85,6 @@ maternal_questions = [
     }
 ]
 
-# Find Maternal-Newborn quiz and add questions
-for quiz in data['quizzes']:
-    if quiz['id'] == 'quiz-nclex-maternal':
-        quiz['questions'].extend(maternal_questions)
-        print(f"Added {len(maternal_questions)} questions to Maternal-Newborn Nursing")
 
 # Additional questions for Pediatric (add 10 more)
 pediatric_questions = [
@@ -159,10 +160,6 @@ pediatric_questions = [
     }
 ]
 
-for quiz in data['quizzes']:
-    if quiz['id'] == 'quiz-nclex-pediatric':
-        quiz['questions'].extend(pediatric_questions)
-        print(f"Added {len(pediatric_questions)} questions to Pediatric Nursing")
 
 # Additional questions for Mental Health (add 10 more)
 mental_health_questions = [
@@ -238,10 +235,6 @@ mental_health_questions = [
     }
 ]
 
-for quiz in data['quizzes']:
-    if quiz['id'] == 'quiz-nclex-mental':
-        quiz['questions'].extend(mental_health_questions)
-        print(f"Added {len(mental_health_questions)} questions to Mental Health Nursing")
 
 # Additional questions for Pharmacology (add 10 more)
 pharmacology_questions = [
@@ -317,19 +310,36 @@ pharmacology_questions = [
     }
 ]
 
-for quiz in data['quizzes']:
-    if quiz['id'] == 'quiz-nclex-pharmacology':
-        quiz['questions'].extend(pharmacology_questions)
-        print(f"Added {len(pharmacology_questions)} questions to Pharmacology & Medication Administration")
 
-# Save updated JSON
-with open('assets/data/nclex_practice_bank.json', 'w', encoding='utf-8') as f:
-    json.dump(data, f, indent=2, ensure_ascii=False)
+BATCHES = {
+    'quiz-nclex-maternal': maternal_questions,
+    'quiz-nclex-pediatric': pediatric_questions,
+    'quiz-nclex-mental': mental_health_questions,
+    'quiz-nclex-pharmacology': pharmacology_questions,
+}
+
+
+def main():
+    rows = [
+        ("add_bulk_questions.py", position, {"quiz": quiz_id, **question})
+        for quiz_id, questions in BATCHES.items()
+        for position, question in enumerate(questions, 1)
+    ]
+    index = QuizIndex([BANK_PATH])
+    # Like before, questions for quizzes the bank does not have are left out;
+    # they are now reported instead of silently dropped.
+    result = ingest_rows(rows, index, skip_invalid=True)
+    report(result)
+
+    counts = {quiz_id: index.question_count(quiz_id) for quiz_id in index.quizzes}
+    total = sum(counts.values())
+    print(f"\n=== TOTALS ===")
+    for quiz_id, (_, quiz) in index.quizzes.items():
+        print(f"{quiz['title']}: {counts[quiz_id]} questions")
+    print(f"\nGRAND TOTAL: {total} questions")
+    if result.written:
+        print("\nSuccessfully updated nclex_practice_bank.json!")
+
 
-# Count totals
-total = sum(len(quiz['questions']) for quiz in data['quizzes'])
-print(f"\n=== TOTALS ===")
-for quiz in data['quizzes']:
-    print(f"{quiz['title']}: {len(quiz['questions'])} questions")
-print(f"\nGRAND TOTAL: {total} questions")
-print("\nSuccessfully updated nclex_practice_bank.json!")
+if __name__ == "__main__":
+    main()
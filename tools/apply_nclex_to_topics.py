@@ -12,15 +12,25 @@ Target topic files:
                                            medication safety drills, mental health, pediatrics,
                                            and any other categories not matched above
 
-The script will avoid duplicating identical question texts already present.
+The script will avoid duplicating questions already present: two questions are
+the same when their normalized stems match (see `dedupe_index`), so re-tagged
+"Case NNN." / "Saunders cue:" variants of an existing prompt are skipped too.
 It also performs a basic validation: ensures `options` or `variants` present and
 `correctIndex` is within range.
+
+All routed questions are merged in memory by `TopicMerger`: each target file is
+read once, deduplicated against its persistent stem index, and
+written once (atomically) at the end. The run reports its disk I/O next to an
+estimate of what the old one-rewrite-per-question approach would have cost.
 """
 import json
 import re
 from pathlib import Path
 from collections import defaultdict
 
+from bank_encoders import write_encoded
+from dedupe_index import DedupeIndex, question_key
+
 ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "assets" / "data"
 NCLEX_FILE = DATA_DIR / "nclex_practice_bank_new.json"
@@ -42,10 +52,6 @@ def load_json(path):
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
-def save_json(path, data):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-
 def choose_target(qtext, category):
     keytext = (category or "") + " " + (qtext or "")
     kl = keytext.lower()
@@ -65,36 +71,83 @@ def normalize_question_dict(q):
         out["options"] = out.get("choices")
     return out
 
-def get_existing_texts(topic_data):
-    texts = set()
-    quizzes = topic_data.get("quizzes") or []
-    for quiz in quizzes:
-        for q in quiz.get("questions", []):
-            texts.add((q.get("text") or "").strip())
-    return texts
-
-def append_question_to_topic(topic_path, question):
-    if not topic_path.exists():
-        print(f"Warning: target file {topic_path} not found; creating basic structure")
-        # create minimal structure
-        data = {"quizzes": [{"title": "Imported", "questions": []}]}
-    else:
-        data = load_json(topic_path)
+class MergeTarget:
+    """One topic file held in memory while questions are merged into it."""
+
+    def __init__(self, path, data, size):
+        self.path = path
+        self.data = data
+        quizzes = data.get("quizzes")
+        if not isinstance(quizzes, list) or len(quizzes) == 0:
+            quizzes = [{"title": "Imported", "questions": []}]
+            data["quizzes"] = quizzes
+        self.quiz = quizzes[0]
+        self.questions = self.quiz.setdefault("questions", [])
+        self.index = DedupeIndex.load(path, data)
+        self.dirty = False
+        # What rewriting the file after every append would have cost.
+        self.legacy_size = size
+
+
+class TopicMerger:
+    """Apply routed questions to topic files in memory; write each file once."""
+
+    def __init__(self):
+        self.targets = {}
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.legacy_bytes_read = 0
+        self.legacy_bytes_written = 0
+        self.legacy_writes = 0
+        self.routed = 0
+
+    def target(self, topic_path):
+        target = self.targets.get(topic_path)
+        if target is None:
+            if not topic_path.exists():
+                print(f"Warning: target file {topic_path} not found; creating basic structure")
+                # create minimal structure
+                data, size = {"quizzes": [{"title": "Imported", "questions": []}]}, 0
+            else:
+                raw = topic_path.read_bytes()
+                data, size = json.loads(raw), len(raw)
+                self.bytes_read += size
+            target = self.targets[topic_path] = MergeTarget(topic_path, data, size)
+        return target
+
+    def add(self, topic_path, question):
+        target = self.target(topic_path)
+        self.routed += 1
+        self.legacy_bytes_read += target.legacy_size
+        key = question_key(target.quiz, 0, len(target.questions), question)
+        if not target.index.add(question.get("text") or "", key):
+            return False
+        target.questions.append(question)
+        target.dirty = True
+        # The appended question sits three levels deep: 6 spaces of indent per line, plus ",\n".
+        encoded = json.dumps(question, indent=2, ensure_ascii=False)
+        target.legacy_size += len(encoded.encode("utf-8")) + 6 * (encoded.count("\n") + 1) + 2
+        self.legacy_bytes_written += target.legacy_size
+        self.legacy_writes += 1
+        return True
+
+    def write(self):
+        for target in self.targets.values():
+            if target.dirty:
+                result = write_encoded(target.path, target.data, ensure_ascii=False, atomic=True)
+                self.bytes_written += result.bytes
+                target.index.save()
+
+    def io_report(self):
+        written = sum(target.dirty for target in self.targets.values())
+        mb = 1024 * 1024
+        return [
+            f" - before (one load and rewrite per question, estimated): {self.routed} reads / "
+            f"{self.legacy_bytes_read / mb:.1f} MB, {self.legacy_writes} writes / {self.legacy_bytes_written / mb:.1f} MB",
+            f" - after (batched merge): {len(self.targets)} reads / {self.bytes_read / mb:.1f} MB, "
+            f"{written} writes / {self.bytes_written / mb:.1f} MB",
+        ]
 
-    quizzes = data.get("quizzes")
-    if not isinstance(quizzes, list) or len(quizzes) == 0:
-        quizzes = [{"title": "Imported", "questions": []}]
-        data["quizzes"] = quizzes
-
-    existing_texts = get_existing_texts(data)
-    qtext = (question.get("text") or "").strip()
-    if qtext in existing_texts:
-        return False
-
-    # Append to first quiz's questions
-    quizzes[0].setdefault("questions", []).append(question)
-    save_json(topic_path, data)
-    return True
 
 def validate_question(question):
     # Basic checks: options present and correctIndex valid
@@ -141,6 +194,7 @@ def main():
     counts = defaultdict(int)
     added = defaultdict(int)
     warnings = defaultdict(int)
+    merger = TopicMerger()
 
     for q in collected:
         qnorm = normalize_question_dict(q)
@@ -156,10 +210,12 @@ def main():
             # still attempt to add, but mark in explanation
             qnorm.setdefault("explanation", "[Imported with validation warning: %s] %s" % (reason, qnorm.get("explanation", "")))
 
-        appended = append_question_to_topic(target_path, qnorm)
+        appended = merger.add(target_path, qnorm)
         if appended:
             added[topic_key] += 1
 
+    merger.write()
+
     print("Mapping complete")
     print("Scanned counts by topic:")
     for k, v in counts.items():
@@ -168,11 +224,15 @@ def main():
         print("Validation warnings:")
         for k, v in warnings.items():
             print(f" - {k}: {v}")
+    print("Disk I/O:")
+    for line in merger.io_report():
+        print(line)
 
     # Show short samples
     print("\nSample additions per topic (first 3):")
     for topic_key, path in TARGET_FILES.items():
-        data = load_json(path) if path.exists() else {"quizzes":[]}
+        target = merger.targets.get(path)
+        data = target.data if target is not None else load_json(path) if path.exists() else {"quizzes":[]}
         qs = []
         for quiz in data.get("quizzes", []):
             qs.extend(quiz.get("questions", []))
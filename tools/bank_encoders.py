@@ -0,0 +1,206 @@
+"""Output encoders shared by the bank writers.
+
+A format is ``pretty``, ``compact`` or ``ndjson``, optionally followed by a
+compression suffix: ``+gzip`` or ``+lzma`` (for example ``compact+gzip``).
+Compressed outputs get ``.gz`` / ``.xz`` appended to their path, and gzip
+members carry no timestamp so identical data always produces identical bytes.
+
+``write_encoded`` can skip writes whose content, ignoring volatile keys such
+as ``generatedAt``, matches what is already on disk, and ``build_timestamp``
+honours ``SOURCE_DATE_EPOCH`` for reproducible builds.
+
+NDJSON writes one record per line. A list becomes one line per element. An
+object starts with a ``{"$keys": [...], "$lists": [...]}`` header, followed by
+one ``{"key": item}`` line per element of each list-valued key and a single
+``{"key": value}`` line for every other key. ``decode`` rebuilds the original
+value from either form.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import lzma
+import os
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Tuple
+
+BASE_FORMATS = ("pretty", "compact", "ndjson")
+COMPRESSORS: Dict[str, Tuple[str, Callable[[bytes], bytes], Callable[[bytes], bytes]]] = {
+    "gzip": (".gz", lambda data: gzip.compress(data, mtime=0), gzip.decompress),
+    "lzma": (".xz", lzma.compress, lzma.decompress),
+}
+FORMATS = BASE_FORMATS + tuple(f"{base}+{name}" for base in BASE_FORMATS for name in COMPRESSORS)
+
+
+@dataclass(frozen=True)
+class EncodeResult:
+    path: Path
+    format: str
+    bytes: int
+    seconds: float
+    written: bool = True
+
+    def describe(self) -> str:
+        state = "" if self.written else ", unchanged so left untouched"
+        return f"{self.path}: {self.format}, {self.bytes:,} bytes, encoded in {self.seconds * 1000:.1f} ms{state}"
+
+
+def build_timestamp() -> datetime:
+    """Now in UTC, or the fixed ``SOURCE_DATE_EPOCH`` time when it is set."""
+    epoch = os.environ.get("SOURCE_DATE_EPOCH")
+    if epoch:
+        return datetime.fromtimestamp(int(epoch), UTC)
+    return datetime.now(UTC)
+
+
+def timestamp_keys(*keys: str) -> Tuple[str, ...]:
+    """``skip_unchanged`` keys for timestamps: ``keys``, or none under ``SOURCE_DATE_EPOCH``.
+
+    A pinned timestamp is part of the reproducible output, so a file whose
+    timestamp differs from it must be rewritten even if nothing else changed.
+    """
+    return () if os.environ.get("SOURCE_DATE_EPOCH") else keys
+
+
+def split_format(fmt: str) -> Tuple[str, str | None]:
+    base, _, compression = fmt.partition("+")
+    if base not in BASE_FORMATS or (compression and compression not in COMPRESSORS):
+        raise ValueError(f"Unknown output format {fmt!r}; expected one of {', '.join(FORMATS)}")
+    return base, compression or None
+
+
+def encoded_path(path: Path, fmt: str) -> Path:
+    """Where ``write_encoded`` puts ``path`` in format ``fmt``."""
+    _, compression = split_format(fmt)
+    if compression is None:
+        return path
+    suffix = COMPRESSORS[compression][0]
+    return path if path.suffix == suffix else path.with_name(path.name + suffix)
+
+
+def _ndjson_records(data: Any) -> Iterator[Any]:
+    if isinstance(data, list):
+        yield from data
+    elif isinstance(data, dict):
+        yield {"$keys": list(data), "$lists": [key for key, value in data.items() if isinstance(value, list)]}
+        for key, value in data.items():
+            if isinstance(value, list):
+                for item in value:
+                    yield {key: item}
+            else:
+                yield {key: value}
+    else:
+        yield data
+
+
+def encode_text(data: Any, base: str, ensure_ascii: bool = True, trailing_newline: bool = False) -> str:
+    if base == "pretty":
+        text = json.dumps(data, indent=2, ensure_ascii=ensure_ascii)
+    elif base == "compact":
+        text = json.dumps(data, separators=(",", ":"), ensure_ascii=ensure_ascii)
+    else:
+        dumps = json.JSONEncoder(separators=(",", ":"), ensure_ascii=ensure_ascii).encode
+        # Every NDJSON line ends with a newline, so there is nothing to add.
+        return "".join(dumps(record) + "\n" for record in _ndjson_records(data))
+    return text + "\n" if trailing_newline else text
+
+
+def encode(data: Any, fmt: str = "pretty", ensure_ascii: bool = True, trailing_newline: bool = False) -> bytes:
+    """Serialize ``data`` in ``fmt``; ``pretty`` matches ``json.dumps(data, indent=2)``."""
+    base, compression = split_format(fmt)
+    raw = encode_text(data, base, ensure_ascii, trailing_newline).encode("utf-8")
+    return COMPRESSORS[compression][1](raw) if compression else raw
+
+
+def decode(payload: bytes, fmt: str = "pretty") -> Any:
+    base, compression = split_format(fmt)
+    text = (COMPRESSORS[compression][2](payload) if compression else payload).decode("utf-8")
+    if base != "ndjson":
+        return json.loads(text)
+    records = [json.loads(line) for line in text.splitlines() if line]
+    header = records[0] if records else None
+    if not (isinstance(header, dict) and header.keys() == {"$keys", "$lists"}):
+        return records
+    merged: Dict[str, Any] = {key: [] for key in header["$lists"]}
+    for record in records[1:]:
+        (key, value), = record.items()
+        if key in header["$lists"]:
+            merged[key].append(value)
+        else:
+            merged[key] = value
+    return {key: merged[key] for key in header["$keys"]}
+
+
+def _without_keys(value: Any, keys: frozenset) -> Any:
+    if isinstance(value, dict):
+        return {key: _without_keys(item, keys) for key, item in value.items() if key not in keys}
+    if isinstance(value, list):
+        return [_without_keys(item, keys) for item in value]
+    return value
+
+
+def content_hash(data: Any, ignore_keys: Iterable[str] = ()) -> str:
+    """Hash ``data`` with ``ignore_keys`` dropped at every depth, independent of format."""
+    stripped = _without_keys(data, frozenset(ignore_keys))
+    return hashlib.sha256(json.dumps(stripped, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+def _unchanged_on_disk(
+    target: Path, data: Any, fmt: str, ignore_keys: Tuple[str, ...], ensure_ascii: bool, trailing_newline: bool
+) -> bool:
+    try:
+        raw = target.read_bytes()
+        existing = decode(raw, fmt)
+    except (OSError, ValueError, EOFError, lzma.LZMAError):
+        return False
+    if content_hash(existing, ignore_keys) != content_hash(data, ignore_keys):
+        return False
+    # Same content, but the file must also already be in the requested encoding.
+    return encode(existing, fmt, ensure_ascii, trailing_newline) == raw
+
+
+def write_encoded(
+    path: Path,
+    data: Any,
+    fmt: str = "pretty",
+    ensure_ascii: bool = True,
+    trailing_newline: bool = False,
+    report: bool = True,
+    skip_unchanged: Iterable[str] | None = None,
+    atomic: bool = False,
+) -> EncodeResult:
+    """Encode ``data`` to ``encoded_path(path, fmt)`` and report size and encode time.
+
+    With ``skip_unchanged`` (a collection of volatile keys, possibly empty) the
+    file is left untouched when its decoded content matches ``data`` once those
+    keys are ignored, so timestamps alone never cause a rewrite. ``atomic``
+    writes a temporary file beside the target and renames it into place, so
+    readers never see a half-written file.
+    """
+    target = encoded_path(Path(path), fmt)
+    started = time.perf_counter()
+    payload = encode(data, fmt, ensure_ascii, trailing_newline)
+    seconds = time.perf_counter() - started
+    unchanged = skip_unchanged is not None and _unchanged_on_disk(
+        target, data, fmt, tuple(skip_unchanged), ensure_ascii, trailing_newline
+    )
+    result = EncodeResult(target, fmt, len(payload), seconds, written=not unchanged)
+    if not unchanged:
+        if atomic:
+            tmp = target.with_name(f".{target.name}.tmp")
+            tmp.write_bytes(payload)
+            os.replace(tmp, target)
+        else:
+            target.write_bytes(payload)
+    if report:
+        print(f"Encoded {result.describe()}")
+    return result
+
+
+def read_encoded(path: Path, fmt: str = "pretty") -> Any:
+    return decode(encoded_path(Path(path), fmt).read_bytes(), fmt)
@@ -0,0 +1,77 @@
+"""Time bulk_ingest on both NCLEX bank layouts and check they end up equivalent.
+
+A generated bank is written twice, nested and ``--layout refs``. The same
+NDJSON batch goes into each: new questions spread over every quiz, plus one
+row in ten that reuses an id already in the bank. The check fails unless both
+runs add and skip the same rows and expanding the refs result gives back the
+nested result.
+
+Usage: python tools/bench_bulk_ingest.py [--count 300] [--rows 20000] [--seed 2024]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import generate_nclex_bank as gen
+from bulk_ingest import QuizIndex, ingest_rows, read_rows
+
+
+def write_batch(path: Path, bank: dict, rows: int) -> None:
+    quiz_ids = [quiz["id"] for quiz in bank["quizzes"]]
+    existing = [question["id"] for question in bank["quizzes"][0]["questions"]]
+    with path.open("w", encoding="utf-8") as fh:
+        for number in range(rows):
+            duplicate = number % 10 == 9
+            row = {
+                "quiz": quiz_ids[number % len(quiz_ids)],
+                "id": existing[number % len(existing)] if duplicate else f"BULK-{number:07d}",
+                "text": f"Bulk question {number}: which action should the nurse take first?",
+                "options": [f"Action {number}-{option}" for option in "ABCD"],
+                "correctIndex": number % 4,
+                "explanation": f"Action {number}-{'ABCD'[number % 4]} addresses the priority concern.",
+            }
+            fh.write(json.dumps(row) + "\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark and cross-check bulk ingestion on nested and refs banks.")
+    parser.add_argument("--count", type=int, default=300, help="Questions in the generated bank (default: 300)")
+    parser.add_argument("--rows", type=int, default=20_000, help="Rows in the NDJSON batch (default: 20000)")
+    parser.add_argument("--seed", type=int, default=2024)
+    args = parser.parse_args()
+
+    nested = gen.generate_bank(args.count, args.seed, created_at="2025-01-01T00:00:00Z")
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        batch = tmp_dir / "batch.ndjson"
+        write_batch(batch, nested, args.rows)
+        banks = {"nested": tmp_dir / "nested.json", "refs": tmp_dir / "refs.json"}
+        banks["nested"].write_text(json.dumps(nested, indent=2), encoding="utf-8")
+        banks["refs"].write_text(json.dumps(gen.to_reference_layout(nested), indent=2), encoding="utf-8")
+
+        results = {}
+        print(f"{'layout':<8} {'added':>7} {'duplicates':>10} {'seconds':>8}")
+        for layout, path in banks.items():
+            started = time.perf_counter()
+            result = ingest_rows(read_rows(batch), QuizIndex([path]))
+            seconds = time.perf_counter() - started
+            if result.errors:
+                raise SystemExit(f"{layout}: {result.errors[0]}")
+            results[layout] = result
+            print(f"{layout:<8} {sum(result.added.values()):>7} {result.duplicates:>10} {seconds:>8.2f}")
+
+        if (results["nested"].added, results["nested"].duplicates) != (results["refs"].added, results["refs"].duplicates):
+            raise SystemExit("The layouts added or skipped different rows")
+        refs = json.loads(banks["refs"].read_text(encoding="utf-8"))
+        if gen.expand_reference_layout(refs) != json.loads(banks["nested"].read_text(encoding="utf-8")):
+            raise SystemExit("Expanding the ingested refs bank does not match the ingested nested bank")
+    print("Both layouts agree")
+
+
+if __name__ == "__main__":
+    main()
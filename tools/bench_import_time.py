@@ -0,0 +1,86 @@
+"""Time importing the question generator modules and first use of their registries.
+
+Each module is imported in a fresh interpreter (so nothing is already cached in
+``sys.modules``), ``--repeat`` times, and the best time is kept. The same child
+process then builds every registered question set once and reports that
+separately, and checks that the import wrote nothing under ``assets/data``.
+
+Usage: python tools/bench_import_time.py [--repeat 5] [MODULE ...]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parent
+MODULES = (
+    "generate_massive_questions",
+    "generate_full_scenarios",
+    "regenerate_nclex_questions",
+    "generate_scenario_questions",
+)
+
+# Runs in the child. Builders that take a count get the largest quiz size any
+# caller asks for; the rest take no arguments.
+CHILD = """
+import importlib, inspect, json, sys, time
+from pathlib import Path
+assets = Path(sys.argv[2])
+def snapshot():
+    return {path.name: path.stat().st_mtime_ns for path in assets.glob("*")}
+before = snapshot()
+started = time.perf_counter()
+module = importlib.import_module(sys.argv[1])
+imported = time.perf_counter()
+written = sorted(name for name, mtime in snapshot().items() if before.get(name) != mtime)
+registry = module.REGISTRY
+count = 0
+started_build = time.perf_counter()
+for key in registry:
+    builder = registry._builders[key]
+    args = (150,) if inspect.signature(builder).parameters else ()
+    count += len(registry.get(key, *args))
+built = time.perf_counter()
+print(json.dumps({"import": imported - started, "build": built - started_build, "questions": count, "written": written}))
+"""
+
+
+def measure(module: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD, module, str(TOOLS_DIR.parent / "assets" / "data")],
+        cwd=TOOLS_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark import time of the question generator modules.")
+    parser.add_argument("modules", nargs="*", default=list(MODULES), help="Modules to import (default: all four)")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per module (default: 5)")
+    args = parser.parse_args()
+
+    print(f"{'module':<30} {'import':>10} {'first use':>10} {'questions':>9}  side effects")
+    failed = False
+    for module in args.modules:
+        runs = [measure(module) for _ in range(args.repeat)]
+        best_import = min(run["import"] for run in runs)
+        best_build = min(run["build"] for run in runs)
+        written = sorted({name for run in runs for name in run["written"]})
+        failed |= bool(written)
+        effects = f"wrote {', '.join(written)}" if written else "none"
+        print(
+            f"{module:<30} {best_import * 1000:>7.2f} ms {best_build * 1000:>7.2f} ms {runs[0]['questions']:>9}  {effects}"
+        )
+    if failed:
+        raise SystemExit("Importing a module wrote files")
+
+
+if __name__ == "__main__":
+    main()
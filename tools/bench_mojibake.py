@@ -0,0 +1,122 @@
+"""Compare the Latin-1 round-trip ``normalize_text`` with ``MojibakeRepairer``.
+
+``legacy_normalize_text`` is the previous ``build_quiz_data.normalize_text``:
+it encoded every string to Latin-1 and decoded it as UTF-8, falling back to the
+input on any error. That costs an encode and a decode per string, and it gives
+up on the Windows-1252 glyphs (``â€¢``, ``â€™``) the sources actually pick up.
+
+The corpus is every string in ``assets/data/*.json`` plus the question bank
+source. ``--inject`` turns that fraction of strings into mojibake by appending
+accented text and mis-decoding the UTF-8 as Latin-1 or Windows-1252, so both
+repair paths are exercised. Each run uses a fresh repairer (cold memo); timings
+are best-of-N with the garbage collector paused.
+
+Usage: python tools/bench_mojibake.py [--inject 0.05] [--repeat 5] [--seed 7]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import random
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterator, List
+
+import build_quiz_data as bqd
+from mojibake import MojibakeRepairer
+
+ASSETS = Path(__file__).resolve().parents[1] / "assets" / "data"
+INJECTED = " • café – 0.5°C"
+
+
+def legacy_normalize_text(value: str) -> str:
+    try:
+        return value.encode("latin-1").decode("utf-8")
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        return value
+
+
+def strings_in(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, list):
+        for item in value:
+            yield from strings_in(item)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield key
+            yield from strings_in(item)
+
+
+def corpus() -> List[str]:
+    strings: List[str] = []
+    for path in sorted(ASSETS.glob("*.json")):
+        strings.extend(strings_in(json.loads(path.read_text(encoding="utf-8"))))
+    for diffs in bqd.parse_question_bank(bqd.SOURCE_PATH).values():
+        for items in diffs.values():
+            strings.extend(strings_in(items))
+    return strings
+
+
+def best_of(repeat: int, run: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            started = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - started)
+        finally:
+            gc.enable()
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark mojibake repair.")
+    parser.add_argument("--inject", type=float, default=0.05, help="Fraction of strings to corrupt (default: 0.05)")
+    parser.add_argument("--repeat", type=int, default=5, help="Best-of-N timing runs (default: 5)")
+    parser.add_argument("--seed", type=int, default=7, help="Seed for choosing strings to corrupt (default: 7)")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    clean = corpus()
+    strings: List[str] = []
+    expected: List[str] = []
+    for value in clean:
+        if rng.random() < args.inject:
+            value += INJECTED
+            codec = rng.choice(("latin-1", "cp1252"))
+            strings.append(value.encode("utf-8").decode(codec, errors="replace"))
+            expected.append(value if "�" not in strings[-1] else strings[-1])
+        else:
+            strings.append(value)
+            expected.append(value)
+
+    legacy_out = [legacy_normalize_text(value) for value in strings]
+    repairer = MojibakeRepairer()
+    engine_out = [repairer.repair(value) for value in strings]
+    # Wherever the round-trip changed a string, the engine must agree with it.
+    for before, old, new in zip(strings, legacy_out, engine_out):
+        if old != before and old != new:
+            raise SystemExit(f"Repairers disagree on {before!r}: {old!r} vs {new!r}")
+    legacy_fixed = sum(out == want for out, want, value in zip(legacy_out, expected, strings) if value != want)
+    engine_fixed = sum(out == want for out, want, value in zip(engine_out, expected, strings) if value != want)
+    broken = sum(value != want for value, want in zip(strings, expected))
+
+    legacy = best_of(args.repeat, lambda: [legacy_normalize_text(value) for value in strings])
+    def run_engine() -> List[str]:
+        repair = MojibakeRepairer().repair
+        return [repair(value) for value in strings]
+
+    engine = best_of(args.repeat, run_engine)
+
+    print(f"{len(strings):,} strings, {broken:,} with injected mojibake")
+    print(f"  legacy round-trip  {legacy * 1000:8.1f} ms  repaired {legacy_fixed:,}/{broken:,}")
+    print(f"  repair engine      {engine * 1000:8.1f} ms  repaired {engine_fixed:,}/{broken:,}  ({legacy / engine:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Compare the nested and reference (``--layout refs``) NCLEX bank layouts.
+
+For each count this prints the serialized size of both layouts, the time to
+``json.loads`` each one, and how long ``expand_reference_layout`` takes to
+rebuild the nested layout for older app builds.
+
+Usage: python tools/bench_nclex_layouts.py [--counts 750 10000 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Callable
+
+import generate_nclex_bank as gen
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Size and parse-time report for NCLEX bank layouts.")
+    parser.add_argument("--counts", type=int, nargs="+", default=[750, 10_000, 100_000])
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of-N timing runs (default: 3)")
+    args = parser.parse_args()
+
+    print(
+        f"{'count':>8}  {'nested MB':>9}  {'refs MB':>8}  {'saved':>6}  "
+        f"{'nested parse ms':>15}  {'refs parse ms':>13}  {'expand ms':>9}"
+    )
+    for count in args.counts:
+        nested = gen.generate_bank(count, args.seed, created_at="2025-01-01T00:00:00Z")
+        refs = gen.to_reference_layout(nested)
+        nested_text = json.dumps(nested, indent=2)
+        refs_text = json.dumps(refs, indent=2)
+        if json.dumps(gen.expand_reference_layout(refs), indent=2) != nested_text:
+            raise SystemExit(f"Expanded refs layout differs from nested layout at count={count}")
+
+        nested_parse = best_of(args.repeat, lambda: json.loads(nested_text))
+        refs_parse = best_of(args.repeat, lambda: json.loads(refs_text))
+        expand = best_of(args.repeat, lambda: gen.expand_reference_layout(refs))
+        nested_mb = len(nested_text.encode("utf-8")) / 1e6
+        refs_mb = len(refs_text.encode("utf-8")) / 1e6
+        print(
+            f"{count:>8}  {nested_mb:>9.2f}  {refs_mb:>8.2f}  {1 - refs_mb / nested_mb:>6.1%}  "
+            f"{nested_parse * 1000:>15.1f}  {refs_parse * 1000:>13.1f}  {expand * 1000:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Throughput of per-question ``choose_options`` versus batched NumPy option matrices.
+
+Both paths produce labelled option lists for the same blueprint mix (every
+blueprint in turn). The batched column includes materialising the rows into
+option dicts, so it is an end-to-end comparison. Requires numpy.
+
+Usage: python tools/bench_nclex_options.py [--counts 10000 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+import generate_nclex_bank as gen
+
+
+def per_question(count: int, seed: int) -> float:
+    rng = random.Random(seed)
+    blueprints = gen.BLUEPRINTS
+    started = time.perf_counter()
+    for i in range(count):
+        gen.choose_options(blueprints[i % len(blueprints)], rng)
+    return time.perf_counter() - started
+
+
+def batched(count: int, seed: int) -> float:
+    generator = gen.load_numpy().random.default_rng(seed)
+    blueprints = gen.BLUEPRINTS
+    started = time.perf_counter()
+    for position, blueprint in enumerate(blueprints):
+        rows = len(range(position, count, len(blueprints)))
+        if not rows:
+            continue
+        table = gen.option_table(blueprint)
+        for row in gen.draw_option_matrix(blueprint, rows, generator).tolist():
+            gen.label_options([table[i] for i in row])
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare per-question and batched option selection.")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--seed", type=int, default=2024)
+    args = parser.parse_args()
+    if not gen.numpy_available():
+        raise SystemExit("numpy is required for this benchmark (pip install numpy)")
+
+    print(f"{'count':>8}  {'per-question q/s':>16}  {'batched q/s':>11}  {'speedup':>7}")
+    for count in args.counts:
+        before = per_question(count, args.seed)
+        after = batched(count, args.seed)
+        print(f"{count:>8}  {count / before:>16,.0f}  {count / after:>11,.0f}  {before / after:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
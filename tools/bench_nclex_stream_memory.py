@@ -0,0 +1,62 @@
+"""Check that ``write_bank_stream`` keeps peak memory flat at 1,000,000 questions.
+
+Streams a ``--count`` question bank to a temporary file (or ``--out``), then
+reads the process's peak resident set size from
+``resource.getrusage(RUSAGE_SELF).ru_maxrss``. The peak covers the whole run,
+including the interpreter and the blueprint catalog. The check fails when the
+peak is above ``--max-rss-mb``. An in-memory build of 50,000 questions already
+peaks at about 459 MB, so the default 64 MB ceiling can only be met by
+streaming.
+
+Usage: python tools/bench_nclex_stream_memory.py [--count 1000000] [--max-rss-mb 64] [--layout nested] [--out PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import generate_nclex_bank as gen
+
+DEFAULT_COUNT = 1_000_000
+DEFAULT_MAX_RSS_MB = 64
+
+
+def peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fail if streaming a large NCLEX bank exceeds an RSS ceiling.")
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT, help="Questions to stream (default: 1000000)")
+    parser.add_argument("--max-rss-mb", type=float, default=DEFAULT_MAX_RSS_MB, help="Peak RSS ceiling (default: 64)")
+    parser.add_argument("--layout", choices=("nested", "refs"), default="nested")
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--out", type=Path, help="Where to write the bank (default: a temporary file, removed after)")
+    args = parser.parse_args()
+
+    before = peak_rss_mb()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.out or Path(tmp) / "nclex_stream.json"
+        started = time.perf_counter()
+        gen.write_bank_stream(path, args.count, args.seed, created_at="2025-01-01T00:00:00Z", layout=args.layout)
+        seconds = time.perf_counter() - started
+        size_mb = path.stat().st_size / 1e6
+    peak = peak_rss_mb()
+
+    print(
+        f"Streamed {args.count:,} questions ({args.layout}, {size_mb:,.0f} MB) in {seconds:.1f} s; "
+        f"peak RSS {peak:.1f} MB ({before:.1f} MB before streaming), ceiling {args.max_rss_mb:.0f} MB"
+    )
+    if peak > args.max_rss_mb:
+        raise SystemExit(f"Peak RSS {peak:.1f} MB exceeds the {args.max_rss_mb:.0f} MB ceiling")
+
+
+if __name__ == "__main__":
+    main()
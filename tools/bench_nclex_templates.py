@@ -0,0 +1,155 @@
+"""Microbenchmark: per-question cost of build_question before and after template precompilation.
+
+``legacy_build_question`` is the previous implementation, which formatted all
+twenty scenario templates (and the stem) for every question. Both versions are
+driven with the same seeded RNG streams and must produce identical questions;
+timings are best-of-N with the garbage collector paused.
+
+Usage: python tools/bench_nclex_templates.py [--counts 750 10000 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import time
+from typing import Callable, List
+
+import generate_nclex_bank as gen
+
+
+def legacy_build_question(blueprint: gen.Blueprint, scenario: gen.ScenarioSeed, idx: int, total: int, rng: random.Random) -> dict:
+    stem_template = rng.choice(list(blueprint.stems))
+    angle = rng.choice(list(blueprint.question_angles))
+    assigned_name = rng.choice(gen.PATIENT_NAMES)
+    
+    # Helper to capitalize the first letter of the patient overview if needed
+    p_overview = scenario.patient_overview
+    p_overview_cap = p_overview[0].upper() + p_overview[1:] if p_overview else p_overview
+
+    # Diverse scenario templates to avoid "The nurse is caring for..." repetition
+    templates = [
+        # Standard Clinical Narrative
+        f"The nurse is caring for {p_overview} ({assigned_name}) in {scenario.setting}. The client is receiving {scenario.therapy}. {scenario.context}",
+        f"{p_overview_cap} ({assigned_name}) is being treated in {scenario.setting} with {scenario.therapy}. {scenario.context}",
+        
+        # Shift Report / Handover
+        f"During shift report, the nurse receives information about {assigned_name}, {p_overview} in {scenario.setting} who is receiving {scenario.therapy}. {scenario.context}",
+        f"The nurse assumes care of {p_overview} ({assigned_name}) in {scenario.setting}. The client's current regimen includes {scenario.therapy}. {scenario.context}",
+        
+        # Assignment / Caseload
+        f"The nurse is assigned to {p_overview} ({assigned_name}) in {scenario.setting}. Current therapy includes {scenario.therapy}. {scenario.context}",
+        f"A nurse in {scenario.setting} is managing the care of {assigned_name}, {p_overview}, who is undergoing {scenario.therapy}. {scenario.context}",
+        
+        # Location / Setting Focus
+        f"In {scenario.setting}, the nurse is evaluating {p_overview} ({assigned_name}) who is receiving {scenario.therapy}. {scenario.context}",
+        f"A client, {assigned_name} ({p_overview}), is admitted to {scenario.setting} for {scenario.therapy}. {scenario.context}",
+        
+        # Action / Assessment Focus
+        f"The nurse is preparing to assess {assigned_name}, {p_overview} in {scenario.setting}, who is currently on {scenario.therapy}. {scenario.context}",
+        f"While assessing {p_overview} ({assigned_name}) in {scenario.setting}, the nurse notes the client is receiving {scenario.therapy}. {scenario.context}",
+        f"The nurse enters the room of {p_overview} ({assigned_name}) in {scenario.setting} to administer {scenario.therapy}. {scenario.context}",
+        
+        # Chart / Record Review
+        f"The nurse reviews the medical record of {p_overview} ({assigned_name}) in {scenario.setting}. The client is prescribed {scenario.therapy}. {scenario.context}",
+        f"Electronic health records for {assigned_name}, {p_overview} in {scenario.setting}, indicate active treatment with {scenario.therapy}. {scenario.context}",
+        
+        # Team / Provider Interaction
+        f"The healthcare provider prescribes {scenario.therapy} for {p_overview} ({assigned_name}) in {scenario.setting}. {scenario.context}",
+        f"An interdisciplinary team in {scenario.setting} is discussing the care plan for {assigned_name}, {p_overview}, who is receiving {scenario.therapy}. {scenario.context}",
+        
+        # Urgent / Emergency Context
+        f"The nurse responds to a call light for {p_overview} ({assigned_name}) in {scenario.setting}. The client is on {scenario.therapy}. {scenario.context}",
+        
+        # Education / Discharge
+        f"The nurse is planning discharge teaching for {p_overview} ({assigned_name}) in {scenario.setting} regarding {scenario.therapy}. {scenario.context}",
+        f"A client, {assigned_name} ({p_overview}), asks the nurse in {scenario.setting} about their {scenario.therapy}. {scenario.context}",
+        
+        # Temporal / Sequence
+        f"Following the initiation of {scenario.therapy} for {p_overview} ({assigned_name}) in {scenario.setting}, the nurse performs an assessment. {scenario.context}",
+        f"At the beginning of the shift in {scenario.setting}, the nurse checks on {assigned_name}, {p_overview}, who is receiving {scenario.therapy}. {scenario.context}",
+    ]
+    
+    scenario_text = rng.choice(templates)
+    
+    stem = stem_template.format(therapy=scenario.therapy, monitoring_focus=scenario.monitoring_focus)
+    options = gen.choose_options(blueprint, rng)
+    correct_labels = [opt["label"] for opt in options if opt["is_correct"]]
+    return {
+        "id": f"NCLEX-{idx:04d}",
+        "sequence": idx,
+        "category": blueprint.category,
+        "theme": blueprint.theme,
+        "case_summary": scenario_text,
+        "question": stem,
+        "angle": angle,
+        "options": options,
+        "correct_labels": correct_labels,
+        "difficulty": blueprint.default_difficulty,
+        "cognitive_level": blueprint.cognitive_level,
+        "blueprint_id": blueprint.id,
+        "references": list(blueprint.references),
+        "rendered_prompt": (
+            f"Question {idx} of {total}\n"
+            f"Category: {blueprint.category}\n\n{scenario_text}\n\n{stem}"
+        ),
+    }
+
+
+def run(builder: Callable[..., dict], count: int, seed: int, keep: bool = False) -> List[dict]:
+    questions: List[dict] = []
+    for shard, start, stop in gen.shard_bounds(count):
+        rng = gen.shard_rng(seed, shard)
+        blueprint_pool = list(gen.BLUEPRINTS)
+        rng.shuffle(blueprint_pool)
+        pool_index = 0
+        for idx in range(start, stop):
+            if pool_index >= len(blueprint_pool):
+                rng.shuffle(blueprint_pool)
+                pool_index = 0
+            blueprint = blueprint_pool[pool_index]
+            pool_index += 1
+            scenario = rng.choice(list(blueprint.scenarios))
+            question = builder(blueprint, scenario, idx, count, rng)
+            if keep:
+                questions.append(question)
+    return questions
+
+
+def time_run(builder: Callable[..., dict], count: int, seed: int) -> float:
+    gc.collect()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        run(builder, count, seed)
+        return time.perf_counter() - started
+    finally:
+        gc.enable()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare build_question cost before and after template precompilation.")
+    parser.add_argument("--counts", type=int, nargs="+", default=[750, 10_000, 100_000])
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--repeat", type=int, default=3, help="Best-of-N timing runs per count (default: 3)")
+    args = parser.parse_args()
+
+    if run(legacy_build_question, 2_000, args.seed, keep=True) != run(gen.build_question, 2_000, args.seed, keep=True):
+        raise SystemExit("legacy and precompiled builders disagree")
+
+    print(f"{'count':>8}  {'before us/q':>12}  {'after us/q':>11}  {'speedup':>7}")
+    for count in args.counts:
+        gen.scenario_fragments.cache_clear()
+        gen.render_stem.cache_clear()
+        # Interleave the runs so clock drift affects both builders alike.
+        before = after = float("inf")
+        for _ in range(args.repeat):
+            before = min(before, time_run(legacy_build_question, count, args.seed))
+            after = min(after, time_run(gen.build_question, count, args.seed))
+        before, after = before / count * 1e6, after / count * 1e6
+        print(f"{count:>8}  {before:>12.2f}  {after:>11.2f}  {before / after:>6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
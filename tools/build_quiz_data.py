@@ -2,16 +2,26 @@
 
 from __future__ import annotations
 
+import argparse
 import ast
-import json
+import hashlib
+import os
+import pickle
+import re
+import time
 from collections import defaultdict
-from datetime import UTC, datetime
 from pathlib import Path
-from typing import DefaultDict, Dict, List
+from typing import DefaultDict, Dict, List, Tuple
+
+from bank_encoders import FORMATS, build_timestamp, timestamp_keys, write_encoded
+from mojibake import DEFAULT_REPAIRER, Repair, repair_text
+from quiz_lint import lint_question_bank, report as report_lint
+from quiz_shards import ASSET_DIR, SHARD_MODES, write_shards
 
 BASE_DIR = Path(__file__).resolve().parents[1]
 SOURCE_PATH = BASE_DIR / "tools" / "question_bank_source.py"
 OUTPUT_PATH = BASE_DIR / "assets" / "data" / "nursing_quizzes.json"
+PARSE_CACHE_DIR = BASE_DIR / "tools" / ".cache"
 CREATED_AT = "2025-01-10T00:00:00.000Z"
 ICON_PATH = "assets/icons/logo.png"
 
@@ -81,13 +91,9 @@ TOPIC_DEFS = {
 }
 
 
-def normalize_text(value: str) -> str:
+def normalize_text(value: str, record: str = "") -> str:
     """Fix mojibake such as â€¢ that crept into the raw source."""
-
-    try:
-        return value.encode("latin-1").decode("utf-8")
-    except (UnicodeEncodeError, UnicodeDecodeError):
-        return value
+    return repair_text(value, record)
 
 
 def q(
@@ -131,83 +137,226 @@ def quiz(quiz_id: str, title: str, topic_id: str, difficulty: str, questions: Li
     }
 
 
-def parse_question_bank(source_path: Path) -> Dict[str, Dict[str, List[dict]]]:
-    question_map: DefaultDict[str, DefaultDict[str, List[dict]]] = defaultdict(
-        lambda: defaultdict(list)
-    )
+class QuestionBankParseError(ValueError):
+    """A ``q(...)`` call or ``cat`` binding in the source could not be read."""
+
+    def __init__(self, message: str, path: Path, line: int, column: int) -> None:
+        super().__init__(f"{path}:{line}:{column}: {message}")
+        self.message = message
+        self.path = path
+        self.line = line
+        self.column = column
+
+
+Q_PARAMS = ("cat", "diff", "suffix", "text", "options", "correct", "explanation")
+
+# (category, difficulty, question) in source order.
+QuestionRecord = Tuple[str, str, dict]
+
+
+class _QuestionCollector(ast.NodeVisitor):
+    """Collect ``q(...)`` calls in source order, resolving ``cat`` by scope."""
+
+    def __init__(self, path: Path, module_scope: Dict[str, object] | None = None, line_offset: int = 0) -> None:
+        self.path = path
+        self.line_offset = line_offset
+        self.scopes: List[Dict[str, object]] = [dict(module_scope or {})]
+        self.records: List[QuestionRecord] = []
+
+    def error(self, message: str, node: ast.AST) -> QuestionBankParseError:
+        return QuestionBankParseError(message, self.path, node.lineno + self.line_offset, node.col_offset + 1)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef) -> None:
+        # Each builder function binds its own ``cat``.
+        self.scopes.append({})
+        self.generic_visit(node)
+        self.scopes.pop()
+
+    def visit_Assign(self, node: ast.Assign) -> None:
+        self.generic_visit(node)
+        if any(isinstance(target, ast.Name) and target.id == "cat" for target in node.targets):
+            self.scopes[-1]["cat"] = self.constant(node.value)
+
+    def visit_Call(self, node: ast.Call) -> None:
+        if isinstance(node.func, ast.Name) and node.func.id == "q":
+            self.add_question(node)
+        else:
+            self.generic_visit(node)
+
+    def constant(self, node: ast.expr) -> object:
+        # Fast paths for the shapes q() arguments take; literal_eval does the rest.
+        if isinstance(node, ast.Constant):
+            return node.value
+        if isinstance(node, ast.List) and all(isinstance(item, ast.Constant) for item in node.elts):
+            return [item.value for item in node.elts]
+        if isinstance(node, ast.Name) and node.id == "cat":
+            for scope in reversed(self.scopes):
+                if "cat" in scope:
+                    return scope["cat"]
+            raise self.error("'cat' is used before it is assigned", node)
+        try:
+            return ast.literal_eval(node)
+        except ValueError:
+            raise self.error(f"expected a literal, found {ast.unparse(node)!r}", node) from None
+
+    def add_question(self, node: ast.Call) -> None:
+        if len(node.args) > len(Q_PARAMS):
+            raise self.error(f"q() takes {len(Q_PARAMS)} arguments, got {len(node.args)}", node)
+        values = dict(zip(Q_PARAMS, (self.constant(arg) for arg in node.args)))
+        for keyword in node.keywords:
+            if keyword.arg not in Q_PARAMS or keyword.arg in values:
+                raise self.error(f"unexpected or repeated q() argument {keyword.arg!r}", keyword.value)
+            values[keyword.arg] = self.constant(keyword.value)
+        missing = [name for name in Q_PARAMS if name not in values]
+        if missing:
+            raise self.error(f"q() is missing {', '.join(missing)}", node)
+
+        record = f"{values['cat']}-{values['diff']}-{values['suffix']}"
+        cat_key = normalize_text(values["cat"], record)
+        question = q(
+            cat_key,
+            values["diff"],
+            values["suffix"],
+            normalize_text(values["text"], record),
+            [normalize_text(opt, record) for opt in values["options"]],
+            values["correct"],
+            normalize_text(values["explanation"], record),
+        )
+        self.records.append((cat_key, values["diff"], question))
 
-    lines = source_path.read_text(encoding="utf-8").splitlines()
-    current_cat: str | None = None
-    i = 0
 
-    while i < len(lines):
-        stripped = lines[i].strip()
+# Top-level definitions and module-level ``cat =`` bindings start a new
+# section; decorators stay with their def.
+SECTION_START = re.compile(r"(?:def|async def|class)\s|@|cat\s*=(?!=)")
 
-        if stripped.startswith("cat") and "=" in stripped:
-            rhs = stripped.split("=", 1)[1].strip()
-            try:
-                current_cat = ast.literal_eval(rhs)
-            except (SyntaxError, ValueError):
-                current_cat = rhs.strip('"')
-            i += 1
-            continue
+# (questions, module scope after the section, mojibake repairs made parsing it)
+SectionEntry = Tuple[List[QuestionRecord], Dict[str, object], List[Repair]]
 
-        if stripped.startswith("q("):
-            block: List[str] = []
-            i += 1
-            while i < len(lines):
-                inner = lines[i]
-                if inner.strip().startswith("),"):
-                    break
-                block.append(inner)
-                i += 1
-            else:
-                raise ValueError("Unterminated question block")
-
-            i += 1  # skip the closing line
-
-            if not block:
-                continue
 
-            first_line = block[0]
-            if first_line.strip().startswith("cat"):
-                if current_cat is None:
-                    raise ValueError("Encountered 'cat' before assignment")
-                leading = first_line[: len(first_line) - len(first_line.lstrip())]
-                block[0] = f'{leading}"{current_cat}",'  # preserve indentation
-
-            args_text = "\n".join(block)
-            tuple_literal = f"({args_text})"
-            try:
-                (
-                    cat_value,
-                    diff,
-                    suffix,
-                    prompt,
-                    options,
-                    correct_idx,
-                    rationale,
-                ) = ast.literal_eval(tuple_literal)
-            except Exception as exc:
-                raise ValueError(f"Failed to parse question near line {i}") from exc
-
-            cat_key = normalize_text(cat_value)
-            normalized_options = [normalize_text(opt) for opt in options]
-
-            question = q(
-                cat_key,
-                diff,
-                suffix,
-                normalize_text(prompt),
-                normalized_options,
-                correct_idx,
-                normalize_text(rationale),
-            )
-            question_map[cat_key][diff].append(question)
-            continue
+def source_sections(source: str) -> List[Tuple[int, str]]:
+    """Split the source into top-level sections as ``(first_line, text)`` pairs."""
+    lines = source.splitlines(keepends=True)
+    starts = [0]
+    for number, line in enumerate(lines):
+        if number and SECTION_START.match(line) and not lines[number - 1].startswith("@"):
+            starts.append(number)
+    starts.append(len(lines))
+    return [(start + 1, "".join(lines[start:stop])) for start, stop in zip(starts, starts[1:]) if stop > start]
+
 
-        i += 1
+def parse_section(
+    source_path: Path, text: str, first_line: int, module_scope: Dict[str, object]
+) -> SectionEntry:
+    """Parse one section; returns its questions, the module scope after it and its repairs.
 
+    The whole source is the section starting at line 1 with an empty scope.
+    """
+    try:
+        tree = ast.parse(text, filename=str(source_path))
+    except SyntaxError as exc:
+        line = (exc.lineno or 1) + first_line - 1
+        raise QuestionBankParseError(exc.msg, source_path, line, exc.offset or 0) from None
+    # Shifting error lines is cheaper than ast.increment_lineno over every node.
+    collector = _QuestionCollector(source_path, module_scope, first_line - 1)
+    start = len(DEFAULT_REPAIRER.repairs)
+    collector.visit(tree)
+    return collector.records, collector.scopes[0], DEFAULT_REPAIRER.repairs[start:]
+
+
+class SectionCache:
+    """Parsed sections pickled under ``tools/.cache``, keyed by a hash of each section.
+
+    Entries keep the mojibake repairs made while parsing, which hits replay
+    into ``DEFAULT_REPAIRER`` so cached builds report them too.
+
+    The file name carries a hash of this module and ``mojibake.py``, so parser
+    changes start a fresh cache. ``save`` keeps only the sections used by the
+    latest run.
+    """
+
+    def __init__(self, cache_dir: Path = PARSE_CACHE_DIR) -> None:
+        parser_hash = hashlib.sha256()
+        for module in (Path(__file__), Path(__file__).with_name("mojibake.py")):
+            parser_hash.update(module.read_bytes())
+        self.path = cache_dir / f"question_bank_sections-{parser_hash.hexdigest()[:16]}.pickle"
+        self.hits = 0
+        self.misses = 0
+        self.used: Dict[str, tuple] = {}
+        try:
+            with self.path.open("rb") as fh:
+                self.entries: Dict[str, tuple] = pickle.load(fh)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            self.entries = {}
+
+    @staticmethod
+    def key(text: str, module_scope: Dict[str, object]) -> str:
+        # The module-level ``cat`` a section inherits is part of its input.
+        return hashlib.sha256(f"{sorted(module_scope.items())!r}\x00{text}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> tuple | None:
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.used[key] = entry
+        return entry
+
+    def put(self, key: str, entry: tuple) -> None:
+        self.used[key] = entry
+
+    def save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            for stale in self.path.parent.glob("question_bank_sections-*.pickle"):
+                if stale != self.path:
+                    stale.unlink()
+            tmp = self.path.with_suffix(".tmp")
+            with tmp.open("wb") as fh:
+                pickle.dump(self.used, fh, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # The cache is an optimisation; a read-only checkout still builds.
+
+
+def _parse_cached(source_path: Path, sections: List[Tuple[int, str]], cache: SectionCache) -> List[SectionEntry]:
+    entries: List[SectionEntry] = []
+    module_scope: Dict[str, object] = {}
+    for first_line, text in sections:
+        key = cache.key(text, module_scope)
+        entry = cache.get(key)
+        if entry is None:
+            entry = parse_section(source_path, text, first_line, module_scope)
+            cache.put(key, entry)
+        else:
+            # Report the same repairs as an uncached build.
+            DEFAULT_REPAIRER.repairs.extend(entry[2])
+        entries.append(entry)
+        module_scope = entry[1]
+    return entries
+
+
+def parse_question_bank(source_path: Path, cache: SectionCache | None = None) -> Dict[str, Dict[str, List[dict]]]:
+    """Read every ``q(...)`` call from the source.
+
+    Without a ``cache`` the source goes through one ``ast.parse`` and one
+    collector walk. That cold parse is slower than the old line scanner (about
+    1.7x on the 10x source in ``bench_question_bank_parser.py``), because
+    ``ast.parse`` alone costs more than the scanner did. The cache is the fast
+    path: with one, the source is split into top-level sections and sections
+    whose text (and inherited module ``cat``) are unchanged reuse their
+    previously parsed questions.
+    """
+    source = source_path.read_text(encoding="utf-8")
+    if cache is None:
+        entries = [parse_section(source_path, source, 1, {})]
+    else:
+        entries = _parse_cached(source_path, source_sections(source), cache)
+
+    question_map: DefaultDict[str, DefaultDict[str, List[dict]]] = defaultdict(lambda: defaultdict(list))
+    for records, _, _ in entries:
+        for cat_key, diff, question in records:
+            question_map[cat_key][diff].append(question)
     return question_map
 
 
@@ -234,23 +383,58 @@ def build_topics(question_bank: Dict[str, Dict[str, List[dict]]]) -> List[dict]:
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Build nursing_quizzes.json from question_bank_source.py.")
+    parser.add_argument("--format", choices=FORMATS, default="pretty", help="Output encoding (default: pretty)")
+    parser.add_argument("--no-cache", action="store_true", help="Reparse every section instead of using tools/.cache")
+    parser.add_argument(
+        "--shard",
+        choices=SHARD_MODES,
+        help="Write one file per topic (or topic and difficulty) plus a manifest instead of nursing_quizzes.json",
+    )
+    parser.add_argument("--shard-dir", type=Path, default=ASSET_DIR, help="Where --shard writes (default: assets/data)")
+    args = parser.parse_args()
+
     if not SOURCE_PATH.exists():
         raise FileNotFoundError(
             f"Question bank source not found: {SOURCE_PATH}"  # pragma: no cover
         )
 
-    question_bank = parse_question_bank(SOURCE_PATH)
+    cache = None if args.no_cache else SectionCache()
+    started = time.perf_counter()
+    question_bank = parse_question_bank(SOURCE_PATH, cache)
+    print(f"Parsed {SOURCE_PATH.name} in {(time.perf_counter() - started) * 1000:.1f} ms")
+    if cache is not None:
+        cache.save()
+        print(f"Parse cache: {cache.hits} hits, {cache.misses} misses")
+    repaired = {repair.record for repair in DEFAULT_REPAIRER.repairs}
+    if repaired:
+        print(f"Repaired mojibake in {len(DEFAULT_REPAIRER.repairs)} strings: {', '.join(sorted(repaired))}")
+    if not report_lint(lint_question_bank(question_bank)):
+        raise SystemExit("Fix the lint errors above; nothing was written")
     topics = build_topics(question_bank)
-    generated_at = datetime.now(UTC).isoformat(timespec="seconds").replace("+00:00", "Z")
+    # SOURCE_DATE_EPOCH pins generatedAt for reproducible builds.
+    generated_at = build_timestamp().isoformat(timespec="seconds").replace("+00:00", "Z")
+    if args.shard:
+        manifest = write_shards(topics, generated_at, args.shard_dir, args.shard, args.format)
+        print(f"Wrote {manifest['questions']} questions to {len(manifest['shards'])} shards in {args.shard_dir}")
+        return
     payload = {
         "generatedAt": generated_at,
         "topics": topics,
     }
 
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    OUTPUT_PATH.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+    # Rewriting only for a new generatedAt would invalidate the Flutter asset
+    # bundle and force a reseed, so unchanged content leaves the file alone
+    # (unless SOURCE_DATE_EPOCH pins generatedAt, which then has to match).
+    result = write_encoded(
+        OUTPUT_PATH, payload, args.format, trailing_newline=True, skip_unchanged=timestamp_keys("generatedAt")
+    )
     total_questions = sum(len(quiz["questions"]) for topic in topics for quiz in topic["quizzes"])
-    print(f"Wrote {total_questions} questions to {OUTPUT_PATH}")
+    if result.written:
+        print(f"Wrote {total_questions} questions to {result.path}")
+    else:
+        print(f"{result.path} already has these {total_questions} questions; left untouched")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,282 @@
+"""Append batches of questions from NDJSON or CSV files to quiz banks.
+
+Every bank named with ``--bank`` is loaded once and indexed by quiz id (the
+nested ``{"quizzes": [...]}`` and ``{"topics": [{"quizzes": [...]}]}``
+layouts, and the ``--layout refs`` layout from ``generate_nclex_bank``, where
+quizzes list ``questionIds`` into a top-level ``questions`` table), together
+with the set of question ids already present. Rows are
+then validated, deduplicated and appended in a single pass: each row costs a
+couple of dictionary lookups, whatever the size of the banks or the batch.
+Each bank that received questions is written once, atomically, keeping its
+original escaping and trailing newline.
+
+A row names its target quiz in ``quiz`` and carries ``id``, ``text``,
+``options``, ``correctIndex`` and ``explanation``, plus optional ``type``
+(default ``mcq``) and ``variants`` (default ``[]``). In CSV, ``options`` is a
+JSON array, or the options are given as ``option1`` ... ``optionN`` columns.
+
+Rows whose id is already in a bank or earlier in the batch are skipped as
+duplicates. Invalid rows abort the run without writing anything unless
+``--skip-invalid`` is given.
+
+Usage: python tools/bulk_ingest.py BATCH... [--bank PATH ...] [--skip-invalid] [--dry-run]
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Sequence, Tuple
+
+from bank_encoders import write_encoded
+
+DEFAULT_BANK = Path(__file__).resolve().parents[1] / "assets" / "data" / "nclex_practice_bank.json"
+REQUIRED_FIELDS = ("quiz", "id", "text", "options", "correctIndex", "explanation")
+OPTIONAL_FIELDS = ("type", "variants")
+REQUIRED_SET = frozenset(REQUIRED_FIELDS)
+KNOWN_FIELDS = frozenset(REQUIRED_FIELDS + OPTIONAL_FIELDS)
+
+# (source name, line number, raw row)
+Row = Tuple[str, int, Dict[str, Any]]
+
+
+class IngestError(NamedTuple):
+    source: str
+    line: int
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.source}:{self.line}: {self.message}"
+
+
+@dataclass
+class BankFile:
+    path: Path
+    data: Any
+    ensure_ascii: bool
+    trailing_newline: bool
+    dirty: bool = False
+    # The top-level question table of a ``--layout refs`` bank, else None.
+    table: List[dict] | None = None
+
+
+@dataclass
+class IngestResult:
+    added: Counter = field(default_factory=Counter)
+    duplicates: int = 0
+    errors: List[IngestError] = field(default_factory=list)
+    written: List[Path] = field(default_factory=list)
+
+
+def _quizzes(data: Any) -> Iterator[dict]:
+    if isinstance(data, dict):
+        yield from data.get("quizzes", ())
+        for entry in data.get("topics", ()):
+            yield from entry.get("quizzes", ())
+
+
+class QuizIndex:
+    """Quiz id -> (bank, quiz) and the question ids already present, across banks."""
+
+    def __init__(self, banks: Sequence[Path]) -> None:
+        self.banks: List[BankFile] = []
+        self.quizzes: Dict[str, Tuple[BankFile, dict]] = {}
+        self.question_ids: set = set()
+        for path in banks:
+            raw = Path(path).read_bytes()
+            bank = BankFile(Path(path), json.loads(raw), raw.isascii(), raw.endswith(b"\n"))
+            if isinstance(bank.data, dict) and isinstance(bank.data.get("questions"), list):
+                bank.table = bank.data["questions"]
+                self.question_ids.update(question["id"] for question in bank.table)
+            self.banks.append(bank)
+            key = "questions" if bank.table is None else "questionIds"
+            for quiz in _quizzes(bank.data):
+                if quiz["id"] in self.quizzes:
+                    raise ValueError(f"Quiz {quiz['id']} appears in both {self.quizzes[quiz['id']][0].path} and {path}")
+                if not isinstance(quiz.get(key), list):
+                    raise ValueError(f"Quiz {quiz['id']} in {path} has no {key!r} list")
+                self.quizzes[quiz["id"]] = (bank, quiz)
+                if bank.table is None:
+                    self.question_ids.update(question["id"] for question in quiz["questions"])
+
+    def question_count(self, quiz_id: str) -> int:
+        """Questions in ``quiz_id``, whichever layout its bank uses."""
+        bank, quiz = self.quizzes[quiz_id]
+        return len(quiz["questions"] if bank.table is None else quiz["questionIds"])
+
+    def add(self, quiz_id: str, question: dict) -> None:
+        """Append ``question`` to ``quiz_id``, and to the question table in the refs layout."""
+        bank, quiz = self.quizzes[quiz_id]
+        if bank.table is None:
+            quiz["questions"].append(question)
+        else:
+            bank.table.append(question)
+            quiz["questionIds"].append(question["id"])
+        self.question_ids.add(question["id"])
+        bank.dirty = True
+
+
+def read_rows(path: Path) -> Iterator[Row]:
+    """Rows of an ``.ndjson``/``.jsonl`` or ``.csv`` batch, with their line numbers."""
+    name = str(path)
+    if path.suffix.lower() == ".csv":
+        with path.open(newline="", encoding="utf-8") as fh:
+            reader = csv.reader(fh)
+            header = next(reader, [])
+            # Resolve columns once: option1..optionN in numeric order, the rest by name.
+            option_columns = [
+                index for _, index in sorted(
+                    (int(key[6:]), index) for index, key in enumerate(header)
+                    if key.startswith("option") and key[6:].isdigit()
+                )
+            ]
+            named = [(index, key) for index, key in enumerate(header) if key and index not in option_columns]
+            for row in reader:
+                values: Dict[str, Any] = {key: row[index] for index, key in named if index < len(row) and row[index]}
+                if "options" in values:
+                    try:
+                        values["options"] = json.loads(values["options"])
+                    except json.JSONDecodeError:
+                        pass  # Reported as "options must be a list".
+                else:
+                    values["options"] = [row[index] for index in option_columns if index < len(row) and row[index]]
+                correct = values.get("correctIndex")
+                if correct is not None and correct.lstrip("-").isdigit():
+                    values["correctIndex"] = int(correct)
+                if "variants" in values:
+                    try:
+                        values["variants"] = json.loads(values["variants"])
+                    except json.JSONDecodeError:
+                        values["$error"] = "variants is not valid JSON"
+                yield name, reader.line_num, values
+        return
+    with path.open(encoding="utf-8") as fh:
+        for line, text in enumerate(fh, 1):
+            if text.strip():
+                try:
+                    record = json.loads(text)
+                except json.JSONDecodeError as exc:
+                    yield name, line, {"$error": f"invalid JSON: {exc.msg}"}
+                    continue
+                if not isinstance(record, dict):
+                    record = {"$error": f"expected a JSON object, found {type(record).__name__}"}
+                yield name, line, record
+
+
+def validate_row(row: Dict[str, Any]) -> str | None:
+    """Why ``row`` cannot become a question, or ``None`` if it can."""
+    if not isinstance(row, dict):
+        return f"expected an object, found {type(row).__name__}"
+    if not REQUIRED_SET <= row.keys() <= KNOWN_FIELDS:
+        if "$error" in row:
+            return row["$error"]
+        missing = [name for name in REQUIRED_FIELDS if name not in row]
+        if missing:
+            return f"missing {', '.join(missing)}"
+        return f"unknown field(s) {', '.join(sorted(set(row) - KNOWN_FIELDS))}"
+    for name in ("quiz", "id", "text", "explanation"):
+        if not isinstance(row[name], str) or not row[name].strip():
+            return f"{name} must be a non-empty string"
+    options = row["options"]
+    if not isinstance(options, list) or len(options) < 2 or not all(isinstance(opt, str) and opt for opt in options):
+        return "options must be a list of at least two non-empty strings"
+    if len(set(options)) != len(options):
+        return "options repeat"
+    correct = row["correctIndex"]
+    if not isinstance(correct, int) or isinstance(correct, bool) or not 0 <= correct < len(options):
+        return f"correctIndex {correct!r} is not one of {len(options)} options"
+    return None
+
+
+def to_question(row: Dict[str, Any]) -> dict:
+    return {
+        "id": row["id"],
+        "text": row["text"],
+        "options": row["options"],
+        "correctIndex": row["correctIndex"],
+        "explanation": row["explanation"],
+        "type": row.get("type", "mcq"),
+        "variants": row.get("variants", []),
+    }
+
+
+def ingest_rows(
+    rows: Iterable[Row], index: QuizIndex, skip_invalid: bool = False, dry_run: bool = False
+) -> IngestResult:
+    """Validate, deduplicate and append ``rows`` in one pass, then write the touched banks."""
+    result = IngestResult()
+    for source, line, row in rows:
+        problem = validate_row(row)
+        if problem is None and row["quiz"] not in index.quizzes:
+            problem = f"unknown quiz {row['quiz']!r}"
+        if problem is not None:
+            result.errors.append(IngestError(source, line, problem))
+            continue
+        if row["id"] in index.question_ids:
+            result.duplicates += 1
+            continue
+        index.add(row["quiz"], to_question(row))
+        result.added[row["quiz"]] += 1
+
+    if dry_run or (result.errors and not skip_invalid):
+        return result
+    for bank in index.banks:
+        if bank.dirty:
+            write_encoded(
+                bank.path,
+                bank.data,
+                ensure_ascii=bank.ensure_ascii,
+                trailing_newline=bank.trailing_newline,
+                atomic=True,
+            )
+            result.written.append(bank.path)
+    return result
+
+
+def ingest(
+    batches: Sequence[Path], banks: Sequence[Path] = (DEFAULT_BANK,), skip_invalid: bool = False, dry_run: bool = False
+) -> IngestResult:
+    index = QuizIndex(banks)
+    rows = (row for batch in batches for row in read_rows(Path(batch)))
+    return ingest_rows(rows, index, skip_invalid, dry_run)
+
+
+def report(result: IngestResult, seconds: float | None = None) -> None:
+    for error in result.errors[:50]:
+        print(error, file=sys.stderr)
+    if len(result.errors) > 50:
+        print(f"... and {len(result.errors) - 50} more", file=sys.stderr)
+    for quiz_id, count in result.added.items():
+        print(f"Added {count} question(s) to {quiz_id}")
+    timing = f" in {seconds:.2f} s" if seconds is not None else ""
+    print(
+        f"Ingested {sum(result.added.values())} question(s), skipped {result.duplicates} duplicate(s), "
+        f"{len(result.errors)} invalid row(s), wrote {len(result.written)} bank(s){timing}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Append NDJSON or CSV question batches to quiz banks.")
+    parser.add_argument("batches", nargs="+", type=Path, help="Batch files (.ndjson, .jsonl or .csv)")
+    parser.add_argument(
+        "--bank", action="append", type=Path, help="Bank to ingest into; repeatable (default: nclex_practice_bank.json)"
+    )
+    parser.add_argument("--skip-invalid", action="store_true", help="Write the valid rows even if some are invalid")
+    parser.add_argument("--dry-run", action="store_true", help="Validate and count without writing")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    result = ingest(args.batches, args.bank or [DEFAULT_BANK], args.skip_invalid, args.dry_run)
+    report(result, time.perf_counter() - started)
+    if result.errors and not args.skip_invalid:
+        raise SystemExit("Invalid rows found; nothing was written")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,9 @@ import json
 import re
 from pathlib import Path
 
+from bank_encoders import write_encoded
+from dedupe_index import DedupeIndex
+
 TARGET_FILES = [
     Path("assets/data/anatomy_quiz.json"),
     Path("assets/data/pharmacology_quiz.json"),
@@ -66,11 +69,19 @@ def clean_file(path: Path) -> None:
                 modified = True
 
     if modified:
-        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        write_encoded(path, data, ensure_ascii=False)
         print(f"Cleaned: {path}")
     else:
         print(f"No changes needed: {path}")
 
+    # Cleaning rewrites question texts, so re-index the file from what was just written.
+    index = DedupeIndex.build(path, data)
+    index.save()
+    if index.duplicates:
+        print(f"  {len(index.duplicates)} question(s) repeat an earlier question's stem, e.g.:")
+        for key, first in index.duplicates[:5]:
+            print(f"   - {key} (same as {first})")
+
 
 def main():
     for p in TARGET_FILES:
@@ -0,0 +1,152 @@
+"""Persistent normalized-stem index of the questions in a topic asset file.
+
+Two prompts count as the same question when their stems match: the stem drops
+``Case NNN.`` tags and ``Saunders cue: ...`` sentences (added by
+``enhance_question_prompts`` and ``make_topic_scenarios``), collapses
+whitespace and ignores case. ``DedupeIndex`` maps a hash of each stem to the id
+of the first question that has it, so a duplicate check is one dictionary
+lookup.
+
+The index for ``assets/data/<name>.json`` is kept in
+``tools/.cache/dedupe/<name>.index.json``, outside the bundled assets. It
+records the asset's size and modification time. ``DedupeIndex.load`` reuses
+the file while those still match and otherwise rebuilds it in one pass. Tools
+that add questions call ``add`` as they go and ``save`` after writing the
+asset, so the index stays current without being rebuilt.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+
+CACHE_DIR = Path(__file__).resolve().parent / ".cache" / "dedupe"
+INDEX_VERSION = 1
+
+_CASE_TAG = re.compile(r"Case\s*\d+\.?\s*")
+_SAUNDERS_CUE = re.compile(r"Saunders\s*cue:\s*(?:[^.?!]*[.?!]\s*)?", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalized_stem(text: str) -> str:
+    stem = _SAUNDERS_CUE.sub("", _CASE_TAG.sub("", text or ""))
+    return _WHITESPACE.sub(" ", stem).strip().casefold()
+
+
+def stem_hash(text: str) -> str:
+    return hashlib.blake2b(normalized_stem(text).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def question_key(quiz: dict, number: int, position: int, question: dict) -> str:
+    """The question's id, or ``quiz-id[position]`` for questions without one."""
+    return question.get("id") or f"{quiz.get('id', number)}[{position}]"
+
+
+def iter_keyed_questions(data: Any) -> Iterator[Tuple[str, dict]]:
+    """``(question_key, question)`` for every question, once each, in any bank layout.
+
+    Nested banks keep questions in each quiz (``quizzes`` or
+    ``topics[].quizzes``); ``--layout refs`` banks keep them in a top-level
+    ``questions`` table that quizzes reference through ``questionIds``. A
+    nested bank may list the same question in several quizzes (the NCLEX banks
+    repeat each one in the comprehensive and its category quiz); only its
+    first appearance is yielded. Anything else raises ``ValueError`` rather than looking like an empty bank.
+    """
+    if not isinstance(data, dict) or not ("quizzes" in data or "topics" in data):
+        raise ValueError("Not a question bank: expected a 'quizzes' or 'topics' key")
+    quizzes = list(data.get("quizzes") or [])
+    for entry in data.get("topics") or []:
+        if isinstance(entry, dict):
+            quizzes.extend(entry.get("quizzes") or [])
+    table = data.get("questions")
+    if isinstance(table, list):
+        known = {question.get("id") for question in table}
+        for quiz in quizzes:
+            missing = [qid for qid in quiz.get("questionIds", []) if qid not in known]
+            if missing:
+                raise ValueError(f"Quiz {quiz.get('id')} references unknown question {missing[0]}")
+        for position, question in enumerate(table):
+            yield question.get("id") or f"questions[{position}]", question
+        return
+    seen = set()
+    for number, quiz in enumerate(quizzes):
+        if not isinstance(quiz.get("questions"), list):
+            raise ValueError(f"Quiz {quiz.get('id', number)} has no 'questions' list and the bank has no question table")
+        for position, question in enumerate(quiz["questions"]):
+            key = question_key(quiz, number, position, question)
+            if key not in seen:
+                seen.add(key)
+                yield key, question
+
+
+class DedupeIndex:
+    """Stem hash -> question id for one asset file."""
+
+    def __init__(self, asset_path: Path, stems: Dict[str, str] | None = None, cache_dir: Path = CACHE_DIR) -> None:
+        self.asset_path = Path(asset_path)
+        self.path = cache_dir / f"{self.asset_path.stem}.index.json"
+        self.stems: Dict[str, str] = stems or {}
+        self.rebuilt = False
+        # (key, key of the first question with the same stem), filled in by ``build``.
+        self.duplicates: List[Tuple[str, str]] = []
+
+    @classmethod
+    def build(cls, asset_path: Path, data: Any, cache_dir: Path = CACHE_DIR) -> "DedupeIndex":
+        index = cls(asset_path, cache_dir=cache_dir)
+        for key, question in iter_keyed_questions(data):
+            first = index.stems.setdefault(stem_hash(question.get("text") or ""), key)
+            if first != key:
+                index.duplicates.append((key, first))
+        index.rebuilt = True
+        return index
+
+    @classmethod
+    def load(cls, asset_path: Path, data: Any = None, cache_dir: Path = CACHE_DIR) -> "DedupeIndex":
+        """The saved index if it matches the asset on disk, else one rebuilt (and saved) from ``data``."""
+        index = cls(asset_path, cache_dir=cache_dir)
+        try:
+            saved = json.loads(index.path.read_text(encoding="utf-8"))
+            if saved.get("version") == INDEX_VERSION and saved.get("asset") == index._asset_state():
+                index.stems = saved["stems"]
+                return index
+        except (OSError, ValueError, KeyError):
+            pass
+        if data is None:
+            data = json.loads(index.asset_path.read_text(encoding="utf-8")) if index.asset_path.exists() else {"quizzes": []}
+        index = cls.build(asset_path, data, cache_dir)
+        index.save()
+        return index
+
+    def _asset_state(self) -> Dict[str, int] | None:
+        try:
+            stat = self.asset_path.stat()
+        except OSError:
+            return None
+        return {"size": stat.st_size, "mtimeNs": stat.st_mtime_ns}
+
+    def find(self, text: str) -> str | None:
+        """Id of the first question with the same stem as ``text``, if any."""
+        return self.stems.get(stem_hash(text))
+
+    def add(self, text: str, key: str) -> bool:
+        """Record ``text`` under ``key``; ``False`` (and no change) if its stem is already present."""
+        digest = stem_hash(text)
+        if digest in self.stems:
+            return False
+        self.stems[digest] = key
+        return True
+
+    def save(self) -> None:
+        """Write the index, stamped with the asset's current size and mtime; call after writing the asset."""
+        payload = {"version": INDEX_VERSION, "asset": self._asset_state(), "stems": self.stems}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # The index is an optimisation; a read-only checkout still works.
@@ -9,6 +9,8 @@ import re
 from pathlib import Path
 from typing import Iterable, List, Tuple
 
+from bank_encoders import FORMATS, write_encoded
+
 RULE = Tuple[re.Pattern[str], List[str]]
 
 SCENARIO_RULES: List[RULE] = [
@@ -302,7 +304,7 @@ def iter_questions(payload: dict) -> Iterable[dict]:
         raise ValueError('Unsupported quiz JSON structure; expected topics or quizzes key.')
 
 
-def process_file(path: Path) -> int:
+def process_file(path: Path, fmt: str = 'pretty') -> int:
     data = json.loads(path.read_text(encoding='utf-8'))
     updates = 0
     for question in iter_questions(data):
@@ -324,13 +326,14 @@ def process_file(path: Path) -> int:
             question['variants'] = unique_vars
             question['text'] = unique_vars[0]
     if updates:
-        path.write_text(json.dumps(data, indent=2) + '\n', encoding='utf-8')
+        write_encoded(path, data, fmt, trailing_newline=True)
     return updates
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description='Apply Saunders-referenced clinical context to quiz questions.')
     parser.add_argument('files', nargs='*', help='Quiz JSON files to update. Defaults to core assets.')
+    parser.add_argument('--format', choices=FORMATS, default='pretty', help='Output encoding (default: pretty)')
     args = parser.parse_args()
 
     if args.files:
@@ -347,7 +350,7 @@ def main() -> None:
         if not target.exists():
             print(f"Skipping missing file: {target}")
             continue
-        updated = process_file(target)
+        updated = process_file(target, args.format)
         total_updates += updated
         print(f"Updated {updated:>3} questions in {target}")
 
@@ -0,0 +1,162 @@
+"""Deduplicate repeated sentences in long-form question text into a shared table.
+
+``pack`` splits every ``text`` and ``explanation`` string into sentence-sized
+fragments (the split happens after ``.``, ``?`` or ``!`` plus whitespace, so
+joining the fragments gives back the exact string). Fragments of at least
+``min_chars`` characters that occur more than once anywhere in the bank move to
+a shared ``fragments`` table. A packed field becomes
+``{"$fragments": [...]}``, a list of literal strings and table indexes. Fields
+with nothing shared stay plain strings.
+
+``expand`` reverses this exactly, so ``encode(expand(pack(bank)))`` is
+byte-identical to ``encode(bank)``.
+
+Run as a script to report what packing would save on existing banks:
+
+    python tools/fragment_store.py [FILES...] [--min-chars 40] [--fields text explanation]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Sequence, Tuple
+
+from bank_encoders import encode, read_encoded
+
+FRAGMENT_KEY = "$fragments"
+PACKED_FIELDS = ("text", "explanation")
+MIN_FRAGMENT_CHARS = 40
+_SENTENCE_END = re.compile(r"(?<=[.!?]\s)")
+
+
+class PackReport(NamedTuple):
+    original_bytes: int
+    packed_bytes: int
+    fragments: int
+    references: int
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.original_bytes - self.packed_bytes
+
+    def describe(self) -> str:
+        ratio = self.saved_bytes / self.original_bytes if self.original_bytes else 0.0
+        return (
+            f"{self.original_bytes:,} -> {self.packed_bytes:,} bytes, saved {self.saved_bytes:,} ({ratio:.1%}); "
+            f"{self.fragments} shared fragment(s), {self.references} reference(s)"
+        )
+
+
+def split_fragments(text: str) -> List[str]:
+    return [part for part in _SENTENCE_END.split(text) if part]
+
+
+def _packable(value: Any, fields: Sequence[str]) -> Iterator[str]:
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key in fields and isinstance(item, str):
+                yield item
+            else:
+                yield from _packable(item, fields)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _packable(item, fields)
+
+
+def pack(
+    bank: Any, fields: Sequence[str] = PACKED_FIELDS, min_chars: int = MIN_FRAGMENT_CHARS
+) -> Tuple[Dict[str, Any], int]:
+    """Return ``({"fragments": table, "bank": packed}, references)`` for ``bank``."""
+    counts = Counter(
+        fragment for text in _packable(bank, fields) for fragment in split_fragments(text) if len(fragment) >= min_chars
+    )
+    index: Dict[str, int] = {}
+    table: List[str] = []
+    references = 0
+
+    def pack_text(text: str) -> Any:
+        nonlocal references
+        parts: List[Any] = []
+        for fragment in split_fragments(text):
+            if counts[fragment] > 1:
+                if fragment not in index:
+                    index[fragment] = len(table)
+                    table.append(fragment)
+                parts.append(index[fragment])
+                references += 1
+            elif parts and isinstance(parts[-1], str):
+                parts[-1] += fragment
+            else:
+                parts.append(fragment)
+        if all(isinstance(part, str) for part in parts):
+            return text
+        return {FRAGMENT_KEY: parts}
+
+    def walk(value: Any) -> Any:
+        if isinstance(value, dict):
+            return {
+                key: pack_text(item) if key in fields and isinstance(item, str) else walk(item)
+                for key, item in value.items()
+            }
+        if isinstance(value, list):
+            return [walk(item) for item in value]
+        return value
+
+    packed = walk(bank)
+    return {"fragments": table, "bank": packed}, references
+
+
+def expand(document: Dict[str, Any]) -> Any:
+    """Rebuild the original bank from a ``pack`` document."""
+    table = document["fragments"]
+
+    def walk(value: Any) -> Any:
+        if isinstance(value, dict):
+            if value.keys() == {FRAGMENT_KEY}:
+                return "".join(table[part] if isinstance(part, int) else part for part in value[FRAGMENT_KEY])
+            return {key: walk(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [walk(item) for item in value]
+        return value
+
+    return walk(document["bank"])
+
+
+def pack_report(
+    bank: Any,
+    fmt: str = "pretty",
+    ensure_ascii: bool = True,
+    fields: Sequence[str] = PACKED_FIELDS,
+    min_chars: int = MIN_FRAGMENT_CHARS,
+) -> Tuple[Dict[str, Any], PackReport]:
+    """Pack ``bank``, check the round trip is byte-identical in ``fmt``, and measure it.
+
+    Sizes are compared as compact JSON, so the extra indentation of the packed
+    document's nesting does not count against it.
+    """
+    document, references = pack(bank, fields, min_chars)
+    if encode(expand(document), fmt, ensure_ascii) != encode(bank, fmt, ensure_ascii):
+        raise ValueError("Expanding the packed bank did not reproduce the original bytes")
+    original = encode(bank, "compact", ensure_ascii)
+    packed = encode(document, "compact", ensure_ascii)
+    return document, PackReport(len(original), len(packed), len(document["fragments"]), references)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Report what the shared-fragment store saves on question banks.")
+    parser.add_argument("files", nargs="*", type=Path, help="Bank JSON files (default: assets/data/*.json)")
+    parser.add_argument("--min-chars", type=int, default=MIN_FRAGMENT_CHARS, help="Shortest fragment worth sharing")
+    parser.add_argument("--fields", nargs="+", default=list(PACKED_FIELDS), help="String fields to pack")
+    args = parser.parse_args()
+
+    files = args.files or sorted(Path("assets/data").glob("*.json"))
+    for path in files:
+        _, report = pack_report(read_encoded(path), fields=args.fields, min_chars=args.min_chars)
+        print(f"{path}: {report.describe()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,24 @@
 """
 Comprehensive NCLEX Scenario Generator
 Generates 700+ detailed real-life nursing scenarios across all categories
+
+Each category's scenarios are registered on ``REGISTRY`` and only built when
+the bank (or another script) asks for them. ``--fragments`` also writes the bank
+with repeated sentences moved into a shared table (see ``fragment_store.py``).
+The app does not read that file, so it goes to ``tools/.cache/`` (or
+``--fragments-out``) rather than into the bundled ``assets/data/``.
 """
 
-import json
+import argparse
 from datetime import datetime
+from pathlib import Path
+
+from bank_encoders import write_encoded
+from fragment_store import pack_report
+from question_registry import QuestionRegistry
+
+REGISTRY = QuestionRegistry("full_scenarios")
+FRAGMENTS_FILE = Path(__file__).resolve().parent / ".cache" / "nclex_practice_bank.fragments.json"
 
 def create_comprehensive_question_bank():
     """Create full NCLEX question bank with 700+ scenario-based questions"""
@@ -30,7 +44,7 @@ def create_comprehensive_question_bank():
         "durationMinutes": 300,
         "createdAt": "2025-11-19T12:00:00.000000Z",
         "isOffline": True,
-        "questions": generate_medsurg_questions(150)
+        "questions": REGISTRY.get("medsurg", 150)
     }
     bank["quizzes"].append(medsurg_quiz)
     
@@ -42,7 +56,7 @@ def create_comprehensive_question_bank():
         "durationMinutes": 200,
         "createdAt": "2025-11-19T12:00:00.000000Z",
         "isOffline": True,
-        "questions": generate_maternal_questions(100)
+        "questions": REGISTRY.get("maternal", 100)
     }
     bank["quizzes"].append(maternal_quiz)
     
@@ -54,7 +68,7 @@ def create_comprehensive_question_bank():
         "durationMinutes": 200,
         "createdAt": "2025-11-19T12:00:00.000000Z",
         "isOffline": True,
-        "questions": generate_pediatric_questions(100)
+        "questions": REGISTRY.get("pediatric", 100)
     }
     bank["quizzes"].append(peds_quiz)
     
@@ -66,7 +80,7 @@ def create_comprehensive_question_bank():
         "durationMinutes": 160,
         "createdAt": "2025-11-19T12:00:00.000000Z",
         "isOffline": True,
-        "questions": generate_mental_health_questions(80)
+        "questions": REGISTRY.get("mental_health", 80)
     }
     bank["quizzes"].append(mental_quiz)
     
@@ -78,7 +92,7 @@ def create_comprehensive_question_bank():
         "durationMinutes": 200,
         "createdAt": "2025-11-19T12:00:00.000000Z",
         "isOffline": True,
-        "questions": generate_pharmacology_questions(100)
+        "questions": REGISTRY.get("pharmacology", 100)
     }
     bank["quizzes"].append(pharm_quiz)
     
@@ -90,7 +104,7 @@ def create_comprehensive_question_bank():
         "durationMinutes": 160,
         "createdAt": "2025-11-19T12:00:00.000000Z",
         "isOffline": True,
-        "questions": generate_fundamentals_questions(80)
+        "questions": REGISTRY.get("fundamentals", 80)
     }
     bank["quizzes"].append(fundamentals_quiz)
     
@@ -102,7 +116,7 @@ def create_comprehensive_question_bank():
         "durationMinutes": 120,
         "createdAt": "2025-11-19T12:00:00.000000Z",
         "isOffline": True,
-        "questions": generate_leadership_questions(60)
+        "questions": REGISTRY.get("leadership", 60)
     }
     bank["quizzes"].append(leadership_quiz)
     
@@ -114,12 +128,13 @@ def create_comprehensive_question_bank():
         "durationMinutes": 120,
         "createdAt": "2025-11-19T12:00:00.000000Z",
         "isOffline": True,
-        "questions": generate_emergency_questions(60)
+        "questions": REGISTRY.get("emergency", 60)
     }
     bank["quizzes"].append(emergency_quiz)
     
     return bank
 
+@REGISTRY.register("medsurg")
 def generate_medsurg_questions(count):
     """Generate Medical-Surgical nursing scenarios"""
     questions = []
@@ -161,6 +176,7 @@ def generate_medsurg_questions(count):
     
     return questions[:count]  # Return exactly the requested number
 
+@REGISTRY.register("maternal")
 def generate_maternal_questions(count):
     """Generate Maternal-Newborn scenarios"""
     questions = []
@@ -184,6 +200,7 @@ def generate_maternal_questions(count):
     
     return questions[:count]
 
+@REGISTRY.register("pediatric")
 def generate_pediatric_questions(count):
     """Generate Pediatric scenarios"""
     questions = []
@@ -207,34 +224,59 @@ def generate_pediatric_questions(count):
     
     return questions[:count]
 
+@REGISTRY.register("mental_health")
 def generate_mental_health_questions(count):
     """Generate Mental Health scenarios"""
     return []  # Placeholder
 
+@REGISTRY.register("pharmacology")
 def generate_pharmacology_questions(count):
     """Generate Pharmacology scenarios"""
     return []  # Placeholder
 
+@REGISTRY.register("fundamentals")
 def generate_fundamentals_questions(count):
     """Generate Fundamentals scenarios"""
     return []  # Placeholder
 
+@REGISTRY.register("leadership")
 def generate_leadership_questions(count):
     """Generate Leadership scenarios"""
     return []  # Placeholder
 
+@REGISTRY.register("emergency")
 def generate_emergency_questions(count):
     """Generate Emergency scenarios"""
     return []  # Placeholder
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate the scenario-based NCLEX question bank.")
+    parser.add_argument(
+        "--fragments",
+        action="store_true",
+        help="Also write nclex_practice_bank.fragments.json with repeated sentences in a shared table",
+    )
+    parser.add_argument(
+        "--fragments-out",
+        type=Path,
+        default=FRAGMENTS_FILE,
+        help="Where --fragments writes (default: tools/.cache/; keep it out of the bundled assets/data/)",
+    )
+    args = parser.parse_args()
+
     print("Generating comprehensive NCLEX question bank...")
     bank = create_comprehensive_question_bank()
     
     output_file = "../assets/data/nclex_practice_bank.json"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(bank, f, indent=2, ensure_ascii=False)
+    write_encoded(output_file, bank, ensure_ascii=False)
     
     total = sum(len(q["questions"]) for q in bank["quizzes"])
     print(f"✅ Generated {total} questions across {len(bank['quizzes'])} categories")
     print(f"📁 Saved to: {output_file}")
+
+    if args.fragments:
+        # pack_report checks that expanding the store reproduces the bank byte for byte.
+        document, report = pack_report(bank, ensure_ascii=False)
+        args.fragments_out.parent.mkdir(parents=True, exist_ok=True)
+        write_encoded(args.fragments_out, document, ensure_ascii=False)
+        print(f"🧩 Fragment store: {report.describe()}")
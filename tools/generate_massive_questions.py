@@ -2,11 +2,20 @@
 """
 Generate massive NCLEX question bank with hundreds of scenario-based questions.
 This script creates original nursing scenarios across all 8 NCLEX categories.
+
+Importing it has no side effects: the question lists are registered on
+``REGISTRY`` and only built when requested, and the bank is only written when
+the script is run.
 """
 
-import json
 from datetime import datetime
 
+from bank_encoders import write_encoded
+from question_registry import QuestionRegistry
+
+REGISTRY = QuestionRegistry("massive")
+
+@REGISTRY.register("medsurg")
 def generate_medsurg_questions():
     """Generate 80+ Medical-Surgical questions"""
     questions = []
@@ -64,6 +73,7 @@ def generate_medsurg_questions():
     questions.extend(cv_scenarios + resp_scenarios)
     return questions
 
+@REGISTRY.register("maternal")
 def generate_maternal_questions():
     """Generate 80+ Maternal-Newborn questions"""
     questions = [
@@ -98,6 +108,7 @@ def generate_maternal_questions():
     ]
     return questions
 
+@REGISTRY.register("pediatric")
 def generate_pediatric_questions():
     """Generate 80+ Pediatric questions"""
     questions = [
@@ -118,52 +129,59 @@ def generate_pediatric_questions():
     ]
     return questions
 
-# Generate questions for all categories
-all_questions = {
-    "topic": {
-        "id": "topic-nclex",
-        "name": "NCLEX-RN Practice - Massive Question Bank",
-        "description": "700+ Real-life nursing scenario-based questions organized by clinical categories",
-        "detailedDescription": "Comprehensive NCLEX-RN practice with hundreds of detailed scenarios covering all nursing specialties.",
-        "icon": "assets/icons/logo.png",
-        "slug": "nclex-practice",
-        "createdAt": datetime.now().isoformat() + "Z"
-    },
-    "quizzes": []
-}
-
-categories = [
-    {
-        "id": "quiz-nclex-medsurg",
-        "title": "Medical-Surgical Nursing",
-        "difficultySlug": "medsurg",
-        "durationMinutes": 180,
-        "questions": generate_medsurg_questions()
-    },
-    {
-        "id": "quiz-nclex-maternal",
-        "title": "Maternal-Newborn Nursing",
-        "difficultySlug": "maternal",
-        "durationMinutes": 120,
-        "questions": generate_maternal_questions()
-    },
-    {
-        "id": "quiz-nclex-pediatric",
-        "title": "Pediatric Nursing",
-        "difficultySlug": "pediatric",
-        "durationMinutes": 120,
-        "questions": generate_pediatric_questions()
+def build_massive_bank():
+    """Assemble the full bank from the registered question lists."""
+    all_questions = {
+        "topic": {
+            "id": "topic-nclex",
+            "name": "NCLEX-RN Practice - Massive Question Bank",
+            "description": "700+ Real-life nursing scenario-based questions organized by clinical categories",
+            "detailedDescription": "Comprehensive NCLEX-RN practice with hundreds of detailed scenarios covering all nursing specialties.",
+            "icon": "assets/icons/logo.png",
+            "slug": "nclex-practice",
+            "createdAt": datetime.now().isoformat() + "Z"
+        },
+        "quizzes": []
     }
-]
 
-for cat in categories:
-    cat["createdAt"] = datetime.now().isoformat() + "Z"
-    cat["isOffline"] = True
-    all_questions["quizzes"].append(cat)
+    categories = [
+        {
+            "id": "quiz-nclex-medsurg",
+            "title": "Medical-Surgical Nursing",
+            "difficultySlug": "medsurg",
+            "durationMinutes": 180,
+            "questions": REGISTRY.get("medsurg")
+        },
+        {
+            "id": "quiz-nclex-maternal",
+            "title": "Maternal-Newborn Nursing",
+            "difficultySlug": "maternal",
+            "durationMinutes": 120,
+            "questions": REGISTRY.get("maternal")
+        },
+        {
+            "id": "quiz-nclex-pediatric",
+            "title": "Pediatric Nursing",
+            "difficultySlug": "pediatric",
+            "durationMinutes": 120,
+            "questions": REGISTRY.get("pediatric")
+        }
+    ]
+
+    for cat in categories:
+        cat["createdAt"] = datetime.now().isoformat() + "Z"
+        cat["isOffline"] = True
+        all_questions["quizzes"].append(cat)
+    return all_questions
+
+def main():
+    all_questions = build_massive_bank()
+
+    # Save to file
+    write_encoded('../assets/data/nclex_practice_bank_MASSIVE.json', all_questions, ensure_ascii=False)
 
-# Save to file
-with open('../assets/data/nclex_practice_bank_MASSIVE.json', 'w', encoding='utf-8') as f:
-    json.dump(all_questions, f, indent=2, ensure_ascii=False)
+    print(f"Generated massive question bank!")
+    print(f"Total questions: {sum(len(q['questions']) for q in all_questions['quizzes'])}")
 
-print(f"Generated massive question bank!")
-print(f"Total questions: {sum(len(q['questions']) for q in all_questions['quizzes'])}")
+if __name__ == "__main__":
+    main()
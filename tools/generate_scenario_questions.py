@@ -2,11 +2,18 @@
 NCLEX Scenario-Based Question Bank Generator
 Generates 700+ real-life nursing scenarios organized by clinical categories
 Similar to nurselab.com exam format
+
+Scenario lists are registered on ``REGISTRY`` under their ``CATEGORIES`` key
+and only built when first requested.
 """
 
-import json
 from datetime import datetime
 
+from bank_encoders import write_encoded
+from question_registry import QuestionRegistry
+
+REGISTRY = QuestionRegistry("scenario_questions")
+
 # Category-based structure matching NCLEX Client Needs categories
 CATEGORIES = {
     "medical_surgical": {
@@ -51,34 +58,42 @@ CATEGORIES = {
     }
 }
 
-# Sample detailed scenarios for Medical-Surgical (will be expanded)
-MEDSURG_SCENARIOS = [
-    {
-        "id": "MS-001",
-        "text": "Nurse Maria is working the night shift in the cardiac care unit when she receives report on Mr. Johnson, a 68-year-old retired construction worker admitted at 3 AM with crushing substernal chest pain radiating to his left arm and jaw. He's diaphoretic, pale, and rates his pain as 9/10. His wife reports he was fine when they went to bed at 10 PM but woke up suddenly with severe pain. Vital signs: BP 88/52 mmHg, HR 118 bpm irregular, RR 28/min, SpO2 89% on room air, temp 98.2°F. The cardiac monitor shows ST-segment elevation in leads II, III, and aVF. An IV line is established with normal saline running at 100 mL/hr. The physician has ordered morphine sulfate 4 mg IV, oxygen therapy, nitroglycerin 0.4 mg SL, and aspirin 325 mg PO. Labs are pending. What is Nurse Maria's priority action?",
-        "options": [
-            "Administer morphine sulfate 4 mg IV push to relieve pain and reduce myocardial oxygen demand",
-            "Apply oxygen via non-rebreather mask at 15 L/min to improve oxygenation immediately",
-            "Obtain a 12-lead ECG and notify the cardiac catheterization lab for possible emergent PCI",
-            "Have Mr. Johnson chew 325 mg aspirin and administer sublingual nitroglycerin 0.4 mg"
-        ],
-        "correctIndex": 1,
-        "explanation": "With SpO2 at 89%, the immediate priority following the ABCs (Airway, Breathing, Circulation) is to restore adequate oxygenation to prevent further myocardial ischemia and arrhythmias. The ST-elevations in inferior leads (II, III, aVF) indicate an inferior wall STEMI, likely from right coronary artery occlusion. While all interventions are important in STEMI management (MONA - Morphine, Oxygen, Nitroglycerin, Aspirin), correcting life-threatening hypoxemia takes precedence. After applying oxygen, Nurse Maria would quickly administer aspirin 325 mg (chewed for faster absorption - antiplatelet effect within 30 minutes), then assess if BP tolerates nitroglycerin (current BP 88/52 is borderline; if it drops further, nitroglycerin could be withheld). Morphine would be given after oxygenation is addressed. The patient needs emergent cardiac catheterization, but airway and breathing stabilization come first."
-    },
-    {
-        "id": "MS-002",
-        "text": "In the intensive care unit at 2 AM, Nurse David is monitoring Mrs. Rodriguez, a 55-year-old woman with a history of cirrhosis secondary to hepatitis C and chronic alcohol use. She was admitted 6 hours ago after vomiting approximately 500 mL of bright red blood at home. An NG tube was placed in the ER showing coffee-ground drainage (150 mL). She's receiving octreotide infusion at 50 mcg/hour, has two 18-gauge IV lines running lactated Ringer's at 150 mL/hr each, and received 2 units PRBCs in the ER. Labs: Hgb 7.2 g/dL (down from 9.1 on admission), platelets 48,000, INR 2.1, albumin 2.2 g/dL, total bilirubin 3.8 mg/dL, ammonia 95 mcg/dL. Suddenly, Mrs. Rodriguez becomes restless, confused, and begins vomiting large amounts of frank bright red blood. Her abdomen is increasingly distended and tense. Vital signs: BP 78/42 mmHg (was 94/60), HR 138 bpm, RR 32/min, temp 97.8°F. She's now disoriented to person and place, pulling at her IV lines and attempting to climb out of bed. What is David's most appropriate immediate intervention?",
-        "options": [
-            "Administer lactulose 30 mL via NG tube to reduce ammonia levels causing hepatic encephalopathy",
-            "Increase both IV fluid rates to maximum (999 mL/hr) and call for emergency O-negative blood transfusion",
-            "Turn Mrs. Rodriguez to her left side, suction her airway, call for help, and prepare for possible emergency intubation",
-            "Assist the physician with immediate insertion of a Minnesota tube (Sengstaken-Blakemore) to tamponade bleeding varices"
-        ],
-        "correctIndex": 2,
-        "explanation": "This patient is in hypovolemic shock from massive esophageal variceal bleeding with imminent airway compromise. The priority is AIRWAY protection following the ABC sequence. With active hematemesis, altered mental status, and inability to protect her airway, aspiration risk is extremely high and potentially fatal. Immediate actions: turn to left lateral position to drain blood from mouth, suction oropharynx, call for rapid response team/physician, and prepare for emergent endotracheal intubation. While aggressive fluid resuscitation and blood products (option 2) are critical in hemorrhagic shock, they're secondary to securing the airway - a blocked airway is lethal within minutes, whereas shock can be temporized briefly. The confusion is primarily from hypotension/cerebral hypoperfusion and hypoxia, not hepatic encephalopathy (option 1) - elevated ammonia (95) is concerning but not the immediate threat. A Minnesota tube (option 4) may be placed after airway is secured, typically by GI or intensivist, as a temporary bridge to endoscopic intervention."
-    },
-    # More scenarios would be added here programmatically
-]
+@REGISTRY.register("medical_surgical")
+def medsurg_scenarios():
+    """Sample detailed scenarios for Medical-Surgical (will be expanded)"""
+    return [
+        {
+            "id": "MS-001",
+            "text": "Nurse Maria is working the night shift in the cardiac care unit when she receives report on Mr. Johnson, a 68-year-old retired construction worker admitted at 3 AM with crushing substernal chest pain radiating to his left arm and jaw. He's diaphoretic, pale, and rates his pain as 9/10. His wife reports he was fine when they went to bed at 10 PM but woke up suddenly with severe pain. Vital signs: BP 88/52 mmHg, HR 118 bpm irregular, RR 28/min, SpO2 89% on room air, temp 98.2°F. The cardiac monitor shows ST-segment elevation in leads II, III, and aVF. An IV line is established with normal saline running at 100 mL/hr. The physician has ordered morphine sulfate 4 mg IV, oxygen therapy, nitroglycerin 0.4 mg SL, and aspirin 325 mg PO. Labs are pending. What is Nurse Maria's priority action?",
+            "options": [
+                "Administer morphine sulfate 4 mg IV push to relieve pain and reduce myocardial oxygen demand",
+                "Apply oxygen via non-rebreather mask at 15 L/min to improve oxygenation immediately",
+                "Obtain a 12-lead ECG and notify the cardiac catheterization lab for possible emergent PCI",
+                "Have Mr. Johnson chew 325 mg aspirin and administer sublingual nitroglycerin 0.4 mg"
+            ],
+            "correctIndex": 1,
+            "explanation": "With SpO2 at 89%, the immediate priority following the ABCs (Airway, Breathing, Circulation) is to restore adequate oxygenation to prevent further myocardial ischemia and arrhythmias. The ST-elevations in inferior leads (II, III, aVF) indicate an inferior wall STEMI, likely from right coronary artery occlusion. While all interventions are important in STEMI management (MONA - Morphine, Oxygen, Nitroglycerin, Aspirin), correcting life-threatening hypoxemia takes precedence. After applying oxygen, Nurse Maria would quickly administer aspirin 325 mg (chewed for faster absorption - antiplatelet effect within 30 minutes), then assess if BP tolerates nitroglycerin (current BP 88/52 is borderline; if it drops further, nitroglycerin could be withheld). Morphine would be given after oxygenation is addressed. The patient needs emergent cardiac catheterization, but airway and breathing stabilization come first."
+        },
+        {
+            "id": "MS-002",
+            "text": "In the intensive care unit at 2 AM, Nurse David is monitoring Mrs. Rodriguez, a 55-year-old woman with a history of cirrhosis secondary to hepatitis C and chronic alcohol use. She was admitted 6 hours ago after vomiting approximately 500 mL of bright red blood at home. An NG tube was placed in the ER showing coffee-ground drainage (150 mL). She's receiving octreotide infusion at 50 mcg/hour, has two 18-gauge IV lines running lactated Ringer's at 150 mL/hr each, and received 2 units PRBCs in the ER. Labs: Hgb 7.2 g/dL (down from 9.1 on admission), platelets 48,000, INR 2.1, albumin 2.2 g/dL, total bilirubin 3.8 mg/dL, ammonia 95 mcg/dL. Suddenly, Mrs. Rodriguez becomes restless, confused, and begins vomiting large amounts of frank bright red blood. Her abdomen is increasingly distended and tense. Vital signs: BP 78/42 mmHg (was 94/60), HR 138 bpm, RR 32/min, temp 97.8°F. She's now disoriented to person and place, pulling at her IV lines and attempting to climb out of bed. What is David's most appropriate immediate intervention?",
+            "options": [
+                "Administer lactulose 30 mL via NG tube to reduce ammonia levels causing hepatic encephalopathy",
+                "Increase both IV fluid rates to maximum (999 mL/hr) and call for emergency O-negative blood transfusion",
+                "Turn Mrs. Rodriguez to her left side, suction her airway, call for help, and prepare for possible emergency intubation",
+                "Assist the physician with immediate insertion of a Minnesota tube (Sengstaken-Blakemore) to tamponade bleeding varices"
+            ],
+            "correctIndex": 2,
+            "explanation": "This patient is in hypovolemic shock from massive esophageal variceal bleeding with imminent airway compromise. The priority is AIRWAY protection following the ABC sequence. With active hematemesis, altered mental status, and inability to protect her airway, aspiration risk is extremely high and potentially fatal. Immediate actions: turn to left lateral position to drain blood from mouth, suction oropharynx, call for rapid response team/physician, and prepare for emergent endotracheal intubation. While aggressive fluid resuscitation and blood products (option 2) are critical in hemorrhagic shock, they're secondary to securing the airway - a blocked airway is lethal within minutes, whereas shock can be temporized briefly. The confusion is primarily from hypotension/cerebral hypoperfusion and hypoxia, not hepatic encephalopathy (option 1) - elevated ammonia (95) is concerning but not the immediate threat. A Minnesota tube (option 4) may be placed after airway is secured, typically by GI or intensivist, as a temporary bridge to endoscopic intervention."
+        },
+        # More scenarios would be added here programmatically
+    ]
+
+def __getattr__(name):
+    # ``MEDSURG_SCENARIOS`` used to be a module constant; build it on first access.
+    if name == "MEDSURG_SCENARIOS":
+        return REGISTRY.get("medical_surgical")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def generate_question_bank():
     """Generate comprehensive NCLEX question bank"""
@@ -110,8 +125,8 @@ def generate_question_bank():
         
         # Add questions for this category
         # In full implementation, each category would have its specialized scenarios
-        if category_key == "medical_surgical":
-            quiz["questions"] = MEDSURG_SCENARIOS
+        if category_key in REGISTRY:
+            quiz["questions"] = REGISTRY.get(category_key)
         
         bank["quizzes"].append(quiz)
     
@@ -123,8 +138,7 @@ def save_question_bank():
     
     output_file = "../assets/data/nclex_practice_bank.json"
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(bank, f, indent=2, ensure_ascii=False)
+    write_encoded(output_file, bank, ensure_ascii=False)
     
     total_questions = sum(len(quiz["questions"]) for quiz in bank["quizzes"])
     print(f"✅ Generated NCLEX question bank with {total_questions} questions")
@@ -3,6 +3,8 @@ import random
 import re
 from pathlib import Path
 
+from bank_encoders import write_encoded
+
 FILES = [
     Path("assets/data/anatomy_quiz.json"),
     Path("assets/data/pharmacology_quiz.json"),
@@ -93,7 +95,7 @@ def process_file(path: Path) -> None:
             modified = True
 
     if modified:
-        path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        write_encoded(path, data, ensure_ascii=False)
         print(f"Updated scenarios in: {path}")
     else:
         print(f"No scenario updates needed: {path}")
@@ -0,0 +1,134 @@
+"""Repair UTF-8 text that was mis-decoded as Latin-1 or Windows-1252 (mojibake).
+
+``MojibakeRepairer.repair`` returns ASCII strings untouched without further
+work. Other strings get one scan with a compiled regular expression, and only
+the byte sequences it matches are re-decoded, so legitimate accented text next
+to a broken run is left alone. Results are memoized, which matters for the option strings the
+banks repeat thousands of times, and every change is recorded for a report.
+
+Run as a script to scan (and with ``--write`` fix) ``assets/data/*.json``:
+
+    python tools/mojibake.py [FILES...] [--write] [--report PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List
+
+from bank_encoders import write_encoded
+
+# Characters a UTF-8 continuation byte (0x80-0xBF) turns into when decoded as
+# Latin-1, plus the Windows-1252 glyphs for 0x80-0x9F (€, ‚, “, •, ™ ...).
+_CP1252_HIGH = bytes(range(0x80, 0xA0)).decode("cp1252", errors="ignore")
+_CONT = "[\u0080-¿" + re.escape(_CP1252_HIGH) + "]"
+MOJIBAKE_RUN = re.compile(
+    f"[Â-ß]{_CONT}|[à-ï]{_CONT}{{2}}|[ð-ô]{_CONT}{{3}}"
+)
+# The same pattern with a group, so ``split`` returns the runs at odd indexes.
+_RUN_SPLIT = re.compile(f"({MOJIBAKE_RUN.pattern})")
+_CP1252_BYTES = {char: char.encode("cp1252") for char in _CP1252_HIGH}
+# A few hundred distinct runs ("â€¢", "Ã©" ...) cover every bank.
+_RUN_MEMO: Dict[str, str] = {}
+
+
+def _redecode(run: str) -> str:
+    fixed = _RUN_MEMO.get(run)
+    if fixed is None:
+        raw = b"".join(_CP1252_BYTES.get(char) or bytes((ord(char),)) for char in run)
+        try:
+            fixed = raw.decode("utf-8")
+        except UnicodeDecodeError:
+            fixed = run
+        _RUN_MEMO[run] = fixed
+    return fixed
+
+
+def _fix(value: str) -> str:
+    # Accented text without a mojibake signature is returned after one scan;
+    # otherwise only the matched runs are re-decoded.
+    if MOJIBAKE_RUN.search(value) is None:
+        return value
+    parts = _RUN_SPLIT.split(value)
+    parts[1::2] = [_redecode(run) for run in parts[1::2]]
+    return "".join(parts)
+
+
+@dataclass(frozen=True)
+class Repair:
+    record: str
+    before: str
+    after: str
+
+
+class MojibakeRepairer:
+    """Memoizing mojibake fixer that remembers which records it changed."""
+
+    def __init__(self) -> None:
+        self._memo: Dict[str, str] = {}
+        self.repairs: List[Repair] = []
+
+    def repair(self, value: str, record: str = "") -> str:
+        if value.isascii():
+            return value
+        fixed = self._memo.get(value)
+        if fixed is None:
+            fixed = self._memo[value] = _fix(value)
+        if fixed is not value and fixed != value:
+            self.repairs.append(Repair(record, value, fixed))
+        return fixed
+
+    def repair_json(self, value: Any, record: str = "") -> Any:
+        """Repair every string in a decoded JSON document; ``record`` names the nearest ``id``."""
+        if isinstance(value, str):
+            return self.repair(value, record)
+        if isinstance(value, list):
+            return [self.repair_json(item, record) for item in value]
+        if isinstance(value, dict):
+            record = str(value.get("id", record))
+            return {key: self.repair_json(item, record) for key, item in value.items()}
+        return value
+
+    def report(self) -> Dict[str, Any]:
+        by_record: Dict[str, List[Dict[str, str]]] = {}
+        for repair in self.repairs:
+            by_record.setdefault(repair.record, []).append({"before": repair.before, "after": repair.after})
+        return {"repairedStrings": len(self.repairs), "records": by_record}
+
+
+# Shared instance for tools that only need the function form.
+DEFAULT_REPAIRER = MojibakeRepairer()
+
+
+def repair_text(value: str, record: str = "") -> str:
+    return DEFAULT_REPAIRER.repair(value, record)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Find and repair mojibake in quiz JSON assets.")
+    parser.add_argument("files", nargs="*", type=Path, help="JSON files to scan (default: assets/data/*.json)")
+    parser.add_argument("--write", action="store_true", help="Rewrite files that contained mojibake")
+    parser.add_argument("--report", type=Path, help="Write the per-record repair report as JSON")
+    args = parser.parse_args()
+
+    files = args.files or sorted(Path("assets/data").glob("*.json"))
+    reports: Dict[str, Any] = {}
+    for path in files:
+        repairer = MojibakeRepairer()
+        text = path.read_text(encoding="utf-8")
+        fixed = repairer.repair_json(json.loads(text))
+        reports[str(path)] = repairer.report()
+        print(f"{path}: {len(repairer.repairs)} repaired string(s) in {len(reports[str(path)]['records'])} record(s)")
+        if args.write and repairer.repairs:
+            # Keep each file's escaping and trailing newline as they were.
+            write_encoded(path, fixed, ensure_ascii=text.isascii(), trailing_newline=text.endswith("\n"))
+    if args.report:
+        write_encoded(args.report, reports, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
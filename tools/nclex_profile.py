@@ -0,0 +1,86 @@
+"""Phase timing and cProfile export used by ``generate_nclex_bank.py --profile``."""
+
+from __future__ import annotations
+
+import cProfile
+import pstats
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+
+class PhaseTimer:
+    """Accumulate wall time per named phase, in the order phases first run."""
+
+    def __init__(self) -> None:
+        self.seconds: Dict[str, float] = {}
+
+    def add(self, name: str, seconds: float) -> None:
+        self.seconds[name] = self.seconds.get(name, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - started)
+
+    def report(self) -> List[str]:
+        total = sum(self.seconds.values()) or 1.0
+        width = max((len(name) for name in self.seconds), default=0)
+        lines = [
+            f"  {name:<{width}}  {seconds * 1000:>10.1f} ms  {seconds / total:>6.1%}"
+            for name, seconds in self.seconds.items()
+        ]
+        lines.append(f"  {'total':<{width}}  {sum(self.seconds.values()) * 1000:>10.1f} ms")
+        return lines
+
+
+Func = Tuple[str, int, str]
+
+
+def _frame_name(func: Func) -> str:
+    filename, line, name = func
+    if filename == "~":
+        # Built-ins are reported as ('~', 0, "<built-in method ...>").
+        return name.strip("<>")
+    return f"{name} ({Path(filename).name}:{line})"
+
+
+def write_collapsed_stacks(profiler: cProfile.Profile, path: Path) -> int:
+    """Write ``profiler``'s data as collapsed stacks (``a;b;c <microseconds>``).
+
+    cProfile only records caller/callee pairs, so full stacks are rebuilt by
+    walking from the root functions and splitting each function's own time
+    across the paths that reach it in proportion to their cumulative time.
+    Recursive edges are cut. The output feeds flamegraph.pl or speedscope.
+    Returns the number of stacks written.
+    """
+    stats = pstats.Stats(profiler).stats
+    children: Dict[Func, List[Tuple[Func, float]]] = {}
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, (_, _, _, edge_cumulative) in callers.items():
+            children.setdefault(caller, []).append((func, edge_cumulative))
+    roots = [func for func, entry in stats.items() if not entry[4]]
+
+    folded: Dict[str, float] = {}
+
+    def walk(func: Func, stack: Tuple[Func, ...], cumulative: float) -> None:
+        own, total = stats[func][2], stats[func][3]
+        if cumulative <= 0 or total <= 0:
+            return
+        scale = cumulative / total
+        key = ";".join(_frame_name(frame) for frame in stack)
+        folded[key] = folded.get(key, 0.0) + own * scale
+        for child, edge in children.get(func, ()):
+            if child not in stack:
+                walk(child, stack + (child,), edge * scale)
+
+    for root in roots:
+        walk(root, (root,), stats[root][3])
+
+    lines = [f"{stack} {round(seconds * 1_000_000)}" for stack, seconds in folded.items() if seconds >= 5e-7]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return len(lines)
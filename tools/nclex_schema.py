@@ -0,0 +1,38 @@
+"""Dataclasses describing NCLEX question blueprints."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+
+@dataclass(frozen=True)
+class OptionSeed:
+    statement: str
+    rationale: str
+    priority: str  # "critical" entries become correct answers
+    tags: Sequence[str]
+
+
+@dataclass(frozen=True)
+class ScenarioSeed:
+    patient_overview: str
+    setting: str
+    therapy: str
+    context: str
+    monitoring_focus: str
+
+
+@dataclass(frozen=True)
+class Blueprint:
+    id: str
+    category: str
+    theme: str
+    stems: Sequence[str]
+    scenarios: Sequence[ScenarioSeed]
+    question_angles: Sequence[str]
+    critical_cues: Sequence[OptionSeed]
+    supportive_cues: Sequence[OptionSeed]
+    default_difficulty: str
+    cognitive_level: str
+    references: Sequence[str]
@@ -0,0 +1,250 @@
+"""Find clusters of near-duplicate questions across question banks with MinHash and LSH.
+
+Each question becomes a set of shingles: word ``--shingle``-grams of its
+normalized stem (see ``dedupe_index.normalized_stem``) plus one shingle per
+normalized option. Two questions are near-duplicates when the Jaccard
+similarity of their shingle sets is at least ``--threshold``, which catches
+template copies that differ only in a patient's name, age or a few words.
+
+Rather than comparing every pair, each distinct shingle set gets a MinHash
+signature of ``--perms`` values. The signature is cut into bands, and only
+sets that agree on a whole band land in the same bucket and become candidate
+pairs. Band and row counts put the LSH threshold ``LSH_MARGIN`` below
+``--threshold``, so pairs just above it are rarely missed. Candidates are
+confirmed with the exact Jaccard similarity, and the confirmed pairs are
+joined into clusters. Questions with identical shingle sets are merged before
+hashing, so exact copies (such as the bank backups) cost nothing extra.
+
+By default every topic file and ``nclex_practice_bank*.json`` bank is scanned,
+skipping the ``.checkpoint.json`` and ``.fragments.json`` sidecars that share
+the bank's name. ``--layout refs`` banks are read through their question table.
+
+Usage: python tools/near_duplicates.py [FILES...] [--threshold 0.8] [--perms 128] [--shingle 3] [--top 20] [--json PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import time
+import zlib
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from random import Random
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Sequence, Tuple
+
+from bank_encoders import write_encoded
+from dedupe_index import iter_keyed_questions, normalized_stem
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "assets" / "data"
+DEFAULT_FILES = ("anatomy_quiz.json", "pharmacology_quiz.json", "nursing_quizzes.json", "nclex_practice_bank*.json")
+# Sidecars that share the bank's name but are not banks (--append checkpoints, --fragments tables).
+SIDECAR_SUFFIXES = (".checkpoint.json", ".fragments.json")
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_PERMS = 128
+DEFAULT_SHINGLE = 3
+# On the bundled banks at 0.8, a margin of 0 finds 162 of the 187 pairs and 0.15 finds all of them.
+LSH_MARGIN = 0.15
+
+_PRIME = (1 << 61) - 1
+_WORD = re.compile(r"\w+")
+
+
+class Question(NamedTuple):
+    file: str
+    key: str
+    text: str
+
+
+@dataclass
+class Cluster:
+    members: List[Question]
+    similarity: float  # lowest confirmed similarity on the edges that joined it
+
+    @property
+    def files(self) -> List[str]:
+        return sorted({member.file for member in self.members})
+
+
+@dataclass
+class DetectionResult:
+    questions: int = 0
+    distinct_sets: int = 0
+    bands: int = 0
+    rows: int = 0
+    candidate_pairs: int = 0
+    confirmed_pairs: int = 0
+    clusters: List[Cluster] = field(default_factory=list)
+
+
+def shingles(question: dict, size: int = DEFAULT_SHINGLE) -> FrozenSet[str]:
+    words = _WORD.findall(normalized_stem(question.get("text") or ""))
+    grams = {" ".join(words[i:i + size]) for i in range(max(len(words) - size + 1, 1))}
+    options = question.get("options") or question.get("variants") or []
+    grams.update("option:" + normalized_stem(option) for option in options if isinstance(option, str))
+    return frozenset(grams)
+
+
+def choose_bands(perms: int, threshold: float) -> Tuple[int, int]:
+    """``(bands, rows)`` with ``bands * rows <= perms`` whose LSH threshold ``(1/b)**(1/r)`` is nearest ``threshold``."""
+    options = ((perms // rows, rows) for rows in range(1, perms + 1))
+    return min(options, key=lambda option: (abs((1 / option[0]) ** (1 / option[1]) - threshold), -option[0]))
+
+
+class MinHasher:
+    """``perms`` universal hash functions ``(a * x + b) mod p`` over 32-bit shingle hashes."""
+
+    def __init__(self, perms: int = DEFAULT_PERMS, seed: int = 1) -> None:
+        rng = Random(seed)
+        self.params = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(perms)]
+
+    def signature(self, grams: Iterable[str]) -> Tuple[int, ...]:
+        hashes = [zlib.crc32(gram.encode("utf-8")) for gram in grams] or [0]
+        return tuple(min([(a * h + b) % _PRIME for h in hashes]) for a, b in self.params)
+
+
+def jaccard(left: FrozenSet[str], right: FrozenSet[str]) -> float:
+    if not left and not right:
+        return 1.0
+    return len(left & right) / len(left | right)
+
+
+def load_questions(paths: Sequence[Path], size: int = DEFAULT_SHINGLE) -> List[Tuple[Question, FrozenSet[str]]]:
+    """One entry per question per file, even if a quiz repeats it or a file is named twice."""
+    loaded = []
+    seen = set()
+    for path in map(Path, paths):
+        resolved = path.resolve()
+        data = json.loads(path.read_text(encoding="utf-8"))
+        for key, question in iter_keyed_questions(data):
+            if (resolved, key) in seen:
+                continue
+            seen.add((resolved, key))
+            loaded.append((Question(path.name, key, question.get("text") or ""), shingles(question, size)))
+    return loaded
+
+
+def detect(
+    questions: Sequence[Tuple[Question, FrozenSet[str]]],
+    threshold: float = DEFAULT_THRESHOLD,
+    perms: int = DEFAULT_PERMS,
+) -> DetectionResult:
+    """Cluster ``questions`` whose shingle sets have Jaccard similarity >= ``threshold``."""
+    result = DetectionResult(questions=len(questions))
+    groups: Dict[FrozenSet[str], List[Question]] = defaultdict(list)
+    for question, grams in questions:
+        groups[grams].append(question)
+    sets = list(groups)
+    result.distinct_sets = len(sets)
+    result.bands, result.rows = bands, rows = choose_bands(perms, max(threshold - LSH_MARGIN, 0.05))
+
+    hasher = MinHasher(bands * rows)
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = defaultdict(list)
+    for number, grams in enumerate(sets):
+        signature = hasher.signature(grams)
+        for band in range(bands):
+            buckets[band, signature[band * rows:(band + 1) * rows]].append(number)
+
+    candidates = set()
+    for members in buckets.values():
+        for i, left in enumerate(members):
+            for right in members[i + 1:]:
+                candidates.add((left, right))
+    result.candidate_pairs = len(candidates)
+
+    parent = list(range(len(sets)))
+
+    def find(node: int) -> int:
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    lowest: Dict[int, float] = {}
+    for left, right in candidates:
+        similarity = jaccard(sets[left], sets[right])
+        if similarity >= threshold:
+            result.confirmed_pairs += 1
+            root_left, root_right = find(left), find(right)
+            if root_left != root_right:
+                parent[root_right] = root_left
+                similarity = min(similarity, lowest.pop(root_right, 1.0))
+            lowest[root_left] = min(similarity, lowest.get(root_left, 1.0))
+
+    members: Dict[int, List[Question]] = defaultdict(list)
+    for number, grams in enumerate(sets):
+        members[find(number)].extend(groups[grams])
+    result.clusters = sorted(
+        (Cluster(sorted(questions), lowest.get(root, 1.0)) for root, questions in members.items() if len(questions) > 1),
+        key=lambda cluster: (-len(cluster.members), cluster.members[0]),
+    )
+    return result
+
+
+def default_files() -> List[Path]:
+    files: List[Path] = []
+    for pattern in DEFAULT_FILES:
+        files.extend(sorted(path for path in DATA_DIR.glob(pattern) if not path.name.endswith(SIDECAR_SUFFIXES)))
+    return files
+
+
+def report(result: DetectionResult, top: int = 20, seconds: float | None = None) -> None:
+    for number, cluster in enumerate(result.clusters[:top], 1):
+        print(
+            f"\nCluster {number}: {len(cluster.members)} question(s) in {', '.join(cluster.files)}, "
+            f"similarity >= {cluster.similarity:.2f}"
+        )
+        for member in cluster.members[:8]:
+            print(f"  - {member.file} {member.key}: {member.text[:100]}")
+        if len(cluster.members) > 8:
+            print(f"  ... and {len(cluster.members) - 8} more")
+    if len(result.clusters) > top:
+        print(f"\n... and {len(result.clusters) - top} more cluster(s)")
+
+    pairs = result.distinct_sets * (result.distinct_sets - 1) // 2
+    duplicated = sum(len(cluster.members) for cluster in result.clusters)
+    timing = f" in {seconds:.2f} s" if seconds is not None else ""
+    print(
+        f"\n{result.questions} question(s), {result.distinct_sets} distinct shingle set(s); "
+        f"LSH {result.bands} bands x {result.rows} rows checked {result.candidate_pairs:,} candidate pair(s) "
+        f"of {pairs:,} possible, {result.confirmed_pairs:,} confirmed"
+    )
+    print(f"{len(result.clusters)} near-duplicate cluster(s) covering {duplicated} question(s){timing}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Find near-duplicate question clusters with MinHash and LSH.")
+    parser.add_argument("files", nargs="*", type=Path, help="Bank JSON files (default: topic files and nclex_practice_bank*.json)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Jaccard similarity to report (default: 0.8)")
+    parser.add_argument("--perms", type=int, default=DEFAULT_PERMS, help="MinHash signature length (default: 128)")
+    parser.add_argument("--shingle", type=int, default=DEFAULT_SHINGLE, help="Words per stem shingle (default: 3)")
+    parser.add_argument("--top", type=int, default=20, help="Clusters to print (default: 20)")
+    parser.add_argument("--json", type=Path, help="Also write every cluster to this JSON report")
+    args = parser.parse_args()
+    if not 0 < args.threshold <= 1:
+        parser.error("--threshold must be in (0, 1]")
+
+    started = time.perf_counter()
+    questions = load_questions(args.files or default_files(), args.shingle)
+    result = detect(questions, args.threshold, args.perms)
+    elapsed = time.perf_counter() - started
+    report(result, args.top, elapsed)
+    if args.json:
+        write_encoded(
+            args.json,
+            {
+                "threshold": args.threshold,
+                "questions": result.questions,
+                "clusters": [
+                    {"similarity": round(cluster.similarity, 4), "members": [member._asdict() for member in cluster.members]}
+                    for cluster in result.clusters
+                ],
+            },
+            ensure_ascii=False,
+        )
+
+
+if __name__ == "__main__":
+    main()
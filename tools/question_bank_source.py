@@ -1,8 +1,9 @@
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import List, Tuple
 
+from bank_encoders import write_encoded
+
 BASE_DIR = Path(__file__).resolve().parents[1]
 OUTPUT_PATH = BASE_DIR / "assets" / "data" / "nursing_quizzes.json"
 CREATED_AT = "2025-01-10T00:00:00.000Z"
@@ -616,78 +617,78 @@ def build_med_surg() -> dict:
         questions,
     )
 
-    easy_questions = [
-      q(
-        "med-surg",
-        "easy",
-        "vfib-defib",
-        "Telemetry shows coarse ventricular fibrillation. What is the nurse's priority action?",
-        [
-          "Activate defibrillation immediately",
-          "Administer nitroglycerin sublingually",
-          "Start a dopamine infusion",
-          "Notify the cardiologist after a full assessment",
-        ],
-        0,
-        "Saunders, p.60 stresses immediate defibrillation for VF before any other interventions to restore an organized rhythm.",
-      ),
-      q(
-        "med-surg",
-        "easy",
-        "burn-stop",
-        "A child sustains a major flame burn. Which intervention comes first?",
-        [
-          "Stop the burning process and secure the airway",
-          "Apply topical antibiotics",
-          "Begin enteral feedings",
-          "Remove all clothing once in the emergency room",
-        ],
-        0,
-        "Saunders, p.894 (Priority Nursing Actions) lists stopping the burn and assessing airway patency as the first steps.",
-      ),
-      q(
-        "med-surg",
-        "easy",
-        "appendicitis-perf",
-        "Why is appendicitis treated promptly with surgery?",
-        [
-          "Perforation can rapidly lead to peritonitis and sepsis",
-          "The appendix regenerates if not removed",
-          "It always causes chronic diarrhea",
-          "The pain resolves without intervention",
-        ],
-        0,
-        "Saunders, p.974 explains that inflamed appendices may perforate within hours, triggering peritonitis and septic shock.",
-      ),
-      q(
-        "med-surg",
-        "easy",
-        "ocp-embolism",
-        "A client smokes and takes combined oral contraceptives. Which complication is she at higher risk for?",
-        [
-          "Pulmonary embolism",
-          "Nephrotic syndrome",
-          "Cholelithiasis",
-          "Appendicitis",
-        ],
-        0,
-        "Saunders, p.60 lists thromboembolic disorders including pulmonary embolism as key contraindications for estrogen therapy.",
-      ),
-      q(
-        "med-surg",
-        "easy",
-        "diabetes-insipidus",
-        "Which condition can cause massive water loss requiring IV fluid replacement?",
-        [
-          "Diabetes insipidus",
-          "Hyperparathyroidism",
-          "Peptic ulcer disease",
-          "Gout",
-        ],
-        0,
-        "Saunders, p.249 identifies diabetes insipidus as a cause of increased water loss that necessitates aggressive fluid management.",
-      ),
-    ]
+  easy_questions: List[dict] = [
+    q(
+      "med-surg",
+      "easy",
+      "vfib-defib",
+      "Telemetry shows coarse ventricular fibrillation. What is the nurse's priority action?",
+      [
+        "Activate defibrillation immediately",
+        "Administer nitroglycerin sublingually",
+        "Start a dopamine infusion",
+        "Notify the cardiologist after a full assessment",
+      ],
+      0,
+      "Saunders, p.60 stresses immediate defibrillation for VF before any other interventions to restore an organized rhythm.",
+    ),
+    q(
+      "med-surg",
+      "easy",
+      "burn-stop",
+      "A child sustains a major flame burn. Which intervention comes first?",
+      [
+        "Stop the burning process and secure the airway",
+        "Apply topical antibiotics",
+        "Begin enteral feedings",
+        "Remove all clothing once in the emergency room",
+      ],
+      0,
+      "Saunders, p.894 (Priority Nursing Actions) lists stopping the burn and assessing airway patency as the first steps.",
+    ),
+    q(
+      "med-surg",
+      "easy",
+      "appendicitis-perf",
+      "Why is appendicitis treated promptly with surgery?",
+      [
+        "Perforation can rapidly lead to peritonitis and sepsis",
+        "The appendix regenerates if not removed",
+        "It always causes chronic diarrhea",
+        "The pain resolves without intervention",
+      ],
+      0,
+      "Saunders, p.974 explains that inflamed appendices may perforate within hours, triggering peritonitis and septic shock.",
+    ),
+    q(
+      "med-surg",
+      "easy",
+      "ocp-embolism",
+      "A client smokes and takes combined oral contraceptives. Which complication is she at higher risk for?",
+      [
+        "Pulmonary embolism",
+        "Nephrotic syndrome",
+        "Cholelithiasis",
+        "Appendicitis",
+      ],
+      0,
+      "Saunders, p.60 lists thromboembolic disorders including pulmonary embolism as key contraindications for estrogen therapy.",
+    ),
+    q(
+      "med-surg",
+      "easy",
+      "diabetes-insipidus",
+      "Which condition can cause massive water loss requiring IV fluid replacement?",
+      [
+        "Diabetes insipidus",
+        "Hyperparathyroidism",
+        "Peptic ulcer disease",
+        "Gout",
+      ],
+      0,
+      "Saunders, p.249 identifies diabetes insipidus as a cause of increased water loss that necessitates aggressive fluid management.",
+    ),
+  ]
 
   medium_questions: List[dict] = []
   medium_questions.extend(
@@ -1803,15 +1804,15 @@ def build_med_surg() -> dict:
           ]
         )
 
-      return {
-        "topic": topic_meta,
-        "quizzes": [
-          make_quiz("easy", "Easy", easy_questions),
-          make_quiz("medium", "Medium", medium_questions),
-          make_quiz("hard", "Hard", hard_questions),
-          make_quiz("rnworthy", "RN Worthy", rn_questions),
-        ],
-      }
+  return {
+    "topic": topic_meta,
+    "quizzes": [
+      make_quiz("easy", "Easy", easy_questions),
+      make_quiz("medium", "Medium", medium_questions),
+      make_quiz("hard", "Hard", hard_questions),
+      make_quiz("rnworthy", "RN Worthy", rn_questions),
+    ],
+  }
 
 
 def build_pediatrics() -> dict:
@@ -1823,7 +1824,7 @@ def build_pediatrics() -> dict:
     "pediatrics",
   )
 
-    def make_quiz(diff: str, label: str, questions: List[dict]) -> dict:
+  def make_quiz(diff: str, label: str, questions: List[dict]) -> dict:
     return quiz(
       f"quiz-peds-{diff}",
       f"Pediatrics • {label}",
@@ -2133,15 +2134,15 @@ def build_pediatrics() -> dict:
   hard_questions: List[dict] = []
   rn_questions: List[dict] = []
 
-    return {
-      "topic": topic_meta,
-      "quizzes": [
-        make_quiz("easy", "Easy", easy_questions),
-        make_quiz("medium", "Medium", medium_questions),
-        make_quiz("hard", "Hard", hard_questions),
-        make_quiz("rnworthy", "RN Worthy", rn_questions),
-      ],
-    }
+  return {
+    "topic": topic_meta,
+    "quizzes": [
+      make_quiz("easy", "Easy", easy_questions),
+      make_quiz("medium", "Medium", medium_questions),
+      make_quiz("hard", "Hard", hard_questions),
+      make_quiz("rnworthy", "RN Worthy", rn_questions),
+    ],
+  }
 
 
 def build_maternal_newborn() -> dict:
@@ -2153,7 +2154,7 @@ def build_maternal_newborn() -> dict:
     "maternal-newborn",
   )
 
-    def make_quiz(diff: str, label: str, questions: List[dict]) -> dict:
+  def make_quiz(diff: str, label: str, questions: List[dict]) -> dict:
     return quiz(
       f"quiz-mat-{diff}",
       f"Maternal-Newborn • {label}",
@@ -2167,15 +2168,15 @@ def build_maternal_newborn() -> dict:
   hard_questions: List[dict] = []
   rn_questions: List[dict] = []
 
-    return {
-      "topic": topic_meta,
-      "quizzes": [
-        make_quiz("easy", "Easy", easy_questions),
-        make_quiz("medium", "Medium", medium_questions),
-        make_quiz("hard", "Hard", hard_questions),
-        make_quiz("rnworthy", "RN Worthy", rn_questions),
-      ],
-    }
+  return {
+    "topic": topic_meta,
+    "quizzes": [
+      make_quiz("easy", "Easy", easy_questions),
+      make_quiz("medium", "Medium", medium_questions),
+      make_quiz("hard", "Hard", hard_questions),
+      make_quiz("rnworthy", "RN Worthy", rn_questions),
+    ],
+  }
 
 
 def build_mental_health() -> dict:
@@ -2187,7 +2188,7 @@ def build_mental_health() -> dict:
     "mental-health",
   )
 
-    def make_quiz(diff: str, label: str, questions: List[dict]) -> dict:
+  def make_quiz(diff: str, label: str, questions: List[dict]) -> dict:
     return quiz(
       f"quiz-mental-{diff}",
       f"Mental Health • {label}",
@@ -2201,15 +2202,15 @@ def build_mental_health() -> dict:
   hard_questions: List[dict] = []
   rn_questions: List[dict] = []
 
-    return {
-      "topic": topic_meta,
-      "quizzes": [
-        make_quiz("easy", "Easy", easy_questions),
-        make_quiz("medium", "Medium", medium_questions),
-        make_quiz("hard", "Hard", hard_questions),
-        make_quiz("rnworthy", "RN Worthy", rn_questions),
-      ],
-    }
+  return {
+    "topic": topic_meta,
+    "quizzes": [
+      make_quiz("easy", "Easy", easy_questions),
+      make_quiz("medium", "Medium", medium_questions),
+      make_quiz("hard", "Hard", hard_questions),
+      make_quiz("rnworthy", "RN Worthy", rn_questions),
+    ],
+  }
 
 
 def build_fundamentals() -> dict:
@@ -2221,7 +2222,7 @@ def build_fundamentals() -> dict:
     "fundamentals",
   )
 
-    def make_quiz(diff: str, label: str, questions: List[dict]) -> dict:
+  def make_quiz(diff: str, label: str, questions: List[dict]) -> dict:
     return quiz(
       f"quiz-fundamentals-{diff}",
       f"Fundamentals • {label}",
@@ -2235,20 +2236,20 @@ def build_fundamentals() -> dict:
   hard_questions: List[dict] = []
   rn_questions: List[dict] = []
 
-    return {
-      "topic": topic_meta,
-      "quizzes": [
-        make_quiz("easy", "Easy", easy_questions),
-        make_quiz("medium", "Medium", medium_questions),
-        make_quiz("hard", "Hard", hard_questions),
-        make_quiz("rnworthy", "RN Worthy", rn_questions),
-      ],
-    }
+  return {
+    "topic": topic_meta,
+    "quizzes": [
+      make_quiz("easy", "Easy", easy_questions),
+      make_quiz("medium", "Medium", medium_questions),
+      make_quiz("hard", "Hard", hard_questions),
+      make_quiz("rnworthy", "RN Worthy", rn_questions),
+    ],
+  }
 
 
 def main() -> None:
   data = {"topics": build_topics()}
-  OUTPUT_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
+  write_encoded(OUTPUT_PATH, data)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,60 @@
+"""Lazy registries for the hand-written question lists in the generator scripts.
+
+Each generator module registers its question builders on a module-level
+``QuestionRegistry`` instead of constructing lists (or writing files) at import
+time. Nothing runs until a question set is first requested, and the result is
+cached, so one script can import another's questions cheaply:
+
+    from generate_massive_questions import REGISTRY
+    questions = REGISTRY.get("medsurg")
+
+Cached lists are shared between callers; copy them before mutating.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, Iterator, List, Tuple
+
+Builder = Callable[..., List[dict]]
+
+
+class QuestionRegistry:
+    """Named question builders that run on first use and are cached afterwards."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._builders: Dict[str, Builder] = {}
+        self._built: Dict[Tuple[str, tuple], List[dict]] = {}
+
+    def register(self, key: str) -> Callable[[Builder], Builder]:
+        """Decorator that registers a builder under ``key`` and returns it unchanged."""
+
+        def decorator(builder: Builder) -> Builder:
+            if key in self._builders:
+                raise ValueError(f"{self.name} registry already has {key!r}")
+            self._builders[key] = builder
+            return builder
+
+        return decorator
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._builders
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._builders)
+
+    def get(self, key: str, *args: object) -> List[dict]:
+        """The questions ``key``'s builder returns for ``args``, built once."""
+        try:
+            return self._built[key, args]
+        except KeyError:
+            pass
+        try:
+            builder = self._builders[key]
+        except KeyError:
+            raise KeyError(f"{self.name} registry has no {key!r}; known: {', '.join(self._builders)}") from None
+        questions = self._built[key, args] = builder(*args)
+        return questions
+
+    def is_built(self, key: str, *args: object) -> bool:
+        return (key, args) in self._built
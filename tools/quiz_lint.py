@@ -0,0 +1,117 @@
+"""Structural lint for the questions parsed from ``question_bank_source.py``.
+
+``lint_question_bank`` walks the parsed ``question_map`` once and keeps hash
+indexes over question ids, normalized prompts and each question's options,
+so every check is a dictionary lookup and the pass is linear in the number
+of questions. ``build_quiz_data`` runs it on the map it has already parsed
+and refuses to write when it finds errors.
+
+Errors: duplicate ids, ``correct`` indices that are not an option, repeated
+options within a question and questions with fewer than two options.
+Warnings: the same prompt used by more than one question, and empty prompts
+or explanations.
+
+Run as a script to lint without building:
+
+    python tools/quiz_lint.py [--no-cache] [--strict]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import time
+from typing import Dict, List, NamedTuple
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class LintIssue(NamedTuple):
+    severity: str  # "error" or "warning"
+    question_id: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.severity}: {self.question_id}: {self.message}"
+
+
+def _normalized(text: str) -> str:
+    return _WHITESPACE.sub(" ", text).strip().casefold()
+
+
+def lint_question_bank(question_map: Dict[str, Dict[str, List[dict]]]) -> List[LintIssue]:
+    issues: List[LintIssue] = []
+    first_with_id: Dict[str, str] = {}
+    first_with_prompt: Dict[str, str] = {}
+    for cat, difficulties in question_map.items():
+        for diff, questions in difficulties.items():
+            for position, question in enumerate(questions, 1):
+                qid = question["id"]
+                where = f"question {position} of {cat}/{diff}"
+                if qid in first_with_id:
+                    issues.append(LintIssue("error", qid, f"{where} reuses the id of {first_with_id[qid]}"))
+                else:
+                    first_with_id[qid] = where
+
+                options = question["options"]
+                if len(options) < 2:
+                    issues.append(LintIssue("error", qid, f"only {len(options)} option(s)"))
+                correct = question["correctIndex"]
+                if not isinstance(correct, int) or isinstance(correct, bool) or not 0 <= correct < len(options):
+                    issues.append(LintIssue("error", qid, f"correct index {correct!r} is not one of {len(options)} options"))
+                seen_options: Dict[str, int] = {}
+                for index, option in enumerate(options):
+                    key = _normalized(option)
+                    if key in seen_options:
+                        issues.append(
+                            LintIssue("error", qid, f"option {index} repeats option {seen_options[key]}: {option!r}")
+                        )
+                    else:
+                        seen_options[key] = index
+
+                prompt = _normalized(question["text"])
+                if not prompt:
+                    issues.append(LintIssue("warning", qid, "empty prompt"))
+                elif prompt in first_with_prompt:
+                    issues.append(LintIssue("warning", qid, f"same prompt as {first_with_prompt[prompt]}"))
+                else:
+                    first_with_prompt[prompt] = qid
+                if not question["explanation"].strip():
+                    issues.append(LintIssue("warning", qid, "empty explanation"))
+    return issues
+
+
+def report(issues: List[LintIssue], strict: bool = False) -> bool:
+    """Print ``issues``; returns whether the bank passes (warnings fail only when ``strict``)."""
+    for issue in issues:
+        print(issue)
+    errors = sum(issue.severity == "error" for issue in issues)
+    warnings = len(issues) - errors
+    print(f"Lint: {errors} error(s), {warnings} warning(s)")
+    return errors == 0 and not (strict and warnings)
+
+
+def main() -> None:
+    import build_quiz_data as bqd
+
+    parser = argparse.ArgumentParser(description="Lint the curated question bank source.")
+    parser.add_argument("--no-cache", action="store_true", help="Reparse every section instead of using tools/.cache")
+    parser.add_argument("--strict", action="store_true", help="Treat warnings as errors")
+    args = parser.parse_args()
+
+    cache = None if args.no_cache else bqd.SectionCache()
+    started = time.perf_counter()
+    question_map = bqd.parse_question_bank(bqd.SOURCE_PATH, cache)
+    parsed = time.perf_counter()
+    issues = lint_question_bank(question_map)
+    linted = time.perf_counter()
+    if cache is not None:
+        cache.save()
+    count = sum(len(questions) for difficulties in question_map.values() for questions in difficulties.values())
+    print(f"Checked {count} questions: parse {(parsed - started) * 1000:.1f} ms, lint {(linted - parsed) * 1000:.1f} ms")
+    if not report(issues, args.strict):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
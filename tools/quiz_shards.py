@@ -0,0 +1,159 @@
+"""Per-topic shards of ``nursing_quizzes.json`` plus a manifest describing them.
+
+``write_shards`` splits the topics built by ``build_quiz_data.build_topics`` into
+one file per topic (``nursing_quizzes.<slug>.json``) or per topic and
+difficulty (``nursing_quizzes.<slug>.<difficulty>.json``) and writes
+``nursing_quizzes.manifest.json``. For each shard the manifest lists its file,
+topic id, quiz ids with question counts and the SHA-256 of the file's bytes.
+Shards carry no timestamps, so their hashes only change when their questions
+do, and the app can seed lazily and skip shards whose hash it has already
+imported. The files sit next to the other assets in ``assets/data/``, which
+``pubspec.yaml`` already bundles.
+
+``verify_shards`` checks a manifest against the files on disk. Run as a script
+to verify:
+
+    python tools/quiz_shards.py [MANIFEST]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from bank_encoders import COMPRESSORS, encoded_path, read_encoded, split_format, timestamp_keys, write_encoded
+
+ASSET_DIR = Path(__file__).resolve().parents[1] / "assets" / "data"
+SHARD_PREFIX = "nursing_quizzes"
+MANIFEST_NAME = f"{SHARD_PREFIX}.manifest.json"
+SHARD_GLOB = f"{SHARD_PREFIX}.*"
+# What shard_payloads names files, plus any compression suffix. The glob also
+# catches nursing_quizzes.json(.gz) and temporary files, which this does not.
+SHARD_NAME = re.compile(
+    rf"{re.escape(SHARD_PREFIX)}\.[a-z0-9-]+(?:\.[a-z]+)?\.json"
+    rf"(?:{'|'.join(re.escape(suffix) for suffix, _, _ in COMPRESSORS.values())})?"
+)
+SHARD_MODES = ("topic", "difficulty")
+
+
+def shard_payloads(topics: List[dict], by: str = "topic") -> List[Tuple[str, dict]]:
+    """Split ``topics`` into ``(file name, payload)`` pairs, in topic order.
+
+    Every payload has the ``{"topic": ..., "quizzes": [...]}`` shape of one
+    entry of ``nursing_quizzes.json``'s ``topics`` list.
+    """
+    if by not in SHARD_MODES:
+        raise ValueError(f"Unknown shard mode {by!r}; expected one of {', '.join(SHARD_MODES)}")
+    shards: List[Tuple[str, dict]] = []
+    for entry in topics:
+        slug = entry["topic"]["slug"]
+        if by == "topic":
+            shards.append((f"{SHARD_PREFIX}.{slug}.json", entry))
+            continue
+        for quiz in entry["quizzes"]:
+            # Quiz ids end in their difficulty, e.g. ``quiz-pharm-rnworthy``.
+            difficulty = quiz["id"].rsplit("-", 1)[-1]
+            shards.append((f"{SHARD_PREFIX}.{slug}.{difficulty}.json", {"topic": entry["topic"], "quizzes": [quiz]}))
+    return shards
+
+
+def _shard_entry(path: Path, payload: dict) -> Dict[str, Any]:
+    return {
+        "file": path.name,
+        "topicId": payload["topic"]["id"],
+        "quizzes": [{"id": quiz["id"], "questions": len(quiz["questions"])} for quiz in payload["quizzes"]],
+        "questions": sum(len(quiz["questions"]) for quiz in payload["quizzes"]),
+        "sha256": hashlib.sha256(path.read_bytes()).hexdigest(),
+    }
+
+
+def write_shards(
+    topics: List[dict], generated_at: str, out_dir: Path = ASSET_DIR, by: str = "topic", fmt: str = "pretty"
+) -> Dict[str, Any]:
+    """Write the shards and manifest into ``out_dir``; returns the manifest.
+
+    Unchanged shards are left untouched, and shard files from an earlier run
+    that the new manifest no longer lists are removed.
+    """
+    split_format(fmt)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    entries: List[Dict[str, Any]] = []
+    written = 0
+    for name, payload in shard_payloads(topics, by):
+        result = write_encoded(out_dir / name, payload, fmt, trailing_newline=True, report=False, skip_unchanged=())
+        written += result.written
+        entries.append(_shard_entry(result.path, payload))
+
+    listed = {entry["file"] for entry in entries}
+    for stale in out_dir.glob(SHARD_GLOB):
+        if SHARD_NAME.fullmatch(stale.name) and stale.name not in listed and stale.name != MANIFEST_NAME:
+            stale.unlink()
+            print(f"Removed stale shard {stale.name}")
+
+    manifest = {
+        "generatedAt": generated_at,
+        "shardBy": by,
+        "format": fmt,
+        "questions": sum(entry["questions"] for entry in entries),
+        "shards": entries,
+    }
+    write_encoded(out_dir / MANIFEST_NAME, manifest, trailing_newline=True, skip_unchanged=timestamp_keys("generatedAt"))
+    print(f"Shards: {len(entries)} listed, {written} rewritten, {len(entries) - written} unchanged")
+    return manifest
+
+
+def verify_shards(manifest_path: Path) -> List[str]:
+    """Compare a manifest with the shards beside it; returns a list of problems."""
+    manifest = read_encoded(manifest_path)
+    out_dir = manifest_path.parent
+    problems: List[str] = []
+    seen_quizzes: Dict[str, str] = {}
+    listed = set()
+    for entry in manifest["shards"]:
+        name = entry["file"]
+        listed.add(name)
+        path = out_dir / name
+        if not path.exists():
+            problems.append(f"{name}: missing")
+            continue
+        if hashlib.sha256(path.read_bytes()).hexdigest() != entry["sha256"]:
+            problems.append(f"{name}: sha256 does not match the manifest")
+        if encoded_path(path, manifest["format"]) != path:
+            problems.append(f"{name}: file name does not match format {manifest['format']}")
+            continue
+        payload = read_encoded(path, manifest["format"])
+        if payload["topic"]["id"] != entry["topicId"]:
+            problems.append(f"{name}: topic {payload['topic']['id']} but manifest says {entry['topicId']}")
+        actual = [{"id": quiz["id"], "questions": len(quiz["questions"])} for quiz in payload["quizzes"]]
+        if actual != entry["quizzes"]:
+            problems.append(f"{name}: quizzes {actual} but manifest says {entry['quizzes']}")
+        for quiz in payload["quizzes"]:
+            if quiz["id"] in seen_quizzes:
+                problems.append(f"{name}: quiz {quiz['id']} also appears in {seen_quizzes[quiz['id']]}")
+            seen_quizzes.setdefault(quiz["id"], name)
+    if sum(entry["questions"] for entry in manifest["shards"]) != manifest["questions"]:
+        problems.append(f"{manifest_path.name}: shard question counts do not add up to {manifest['questions']}")
+    for orphan in sorted(out_dir.glob(SHARD_GLOB)):
+        if SHARD_NAME.fullmatch(orphan.name) and orphan.name not in listed and orphan.name != manifest_path.name:
+            problems.append(f"{orphan.name}: not listed in the manifest")
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Verify sharded quiz assets against their manifest.")
+    parser.add_argument("manifest", nargs="?", type=Path, default=ASSET_DIR / MANIFEST_NAME, help="Manifest to check")
+    args = parser.parse_args()
+
+    problems = verify_shards(args.manifest)
+    for problem in problems:
+        print(problem)
+    if problems:
+        raise SystemExit(f"{len(problems)} problem(s) in {args.manifest}")
+    print(f"{args.manifest}: all shards match")
+
+
+if __name__ == "__main__":
+    main()
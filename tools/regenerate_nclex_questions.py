@@ -3,11 +3,19 @@ Regenerate accurate NCLEX-RN practice questions.
 
 This script generates high-quality NCLEX-style questions that accurately 
 match answers to scenarios, following the NCLEX test plan methodology.
+
+The questions are registered on ``REGISTRY`` as ``"nclex"`` and only built
+when first requested.
 """
 
-import json
 from datetime import datetime, timezone
 
+from bank_encoders import write_encoded
+from question_registry import QuestionRegistry
+
+REGISTRY = QuestionRegistry("regenerate_nclex")
+
+@REGISTRY.register("nclex")
 def create_nclex_questions():
     """Create 100 accurate NCLEX-RN practice questions."""
     
@@ -235,7 +243,7 @@ def create_nclex_questions():
 def create_nclex_quiz_bank():
     """Create the complete NCLEX practice bank JSON file."""
     
-    questions = create_nclex_questions()
+    questions = REGISTRY.get("nclex")
     
     # Create the full structure
     quiz_bank = {
@@ -296,8 +304,7 @@ if __name__ == "__main__":
     quiz_bank = create_nclex_quiz_bank()
     
     output_file = "../assets/data/nclex_practice_bank_sample.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(quiz_bank, f, indent=2, ensure_ascii=False)
+    write_encoded(output_file, quiz_bank, ensure_ascii=False)
     
     print(f"✓ Generated {len(quiz_bank['quizzes'][0]['questions'])} sample NCLEX questions")
     print(f"✓ Saved to {output_file}")
@@ -0,0 +1,71 @@
+import pytest
+
+from build_quiz_data import QuestionBankParseError, SectionCache, parse_question_bank
+from mojibake import DEFAULT_REPAIRER
+
+SOURCE = '''\
+cat = "pharm"
+
+
+def build_pharm():
+  return [
+    q(
+      cat,
+      "easy",
+      "first",
+      "Which action first?",
+      ["Assess", "Document"],
+      0,
+      "Assess first.",
+    ),
+  ]
+
+
+def build_broken():
+  return [
+    q(cat, "easy", "second", "Which finding?", ["A", "B"], 0, unknown_name),
+  ]
+'''
+
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_errors_carry_the_source_line_and_column(tmp_path, cached):
+    source = tmp_path / "source.py"
+    source.write_text(SOURCE, encoding="utf-8")
+    cache = SectionCache(tmp_path / "cache") if cached else None
+
+    with pytest.raises(QuestionBankParseError) as raised:
+        parse_question_bank(source, cache)
+
+    assert (raised.value.line, raised.value.column) == (20, 63)
+
+
+def test_cold_and_cached_parses_agree(tmp_path):
+    source = tmp_path / "source.py"
+    source.write_text(SOURCE.split("\n\ndef build_broken")[0] + "\n", encoding="utf-8")
+
+    cold = parse_question_bank(source)
+    cache = SectionCache(tmp_path / "cache")
+    parse_question_bank(source, cache)
+    cache.save()
+
+    assert parse_question_bank(source, SectionCache(tmp_path / "cache")) == cold
+    assert [question["id"] for question in cold["pharm"]["easy"]] == ["pharm-easy-first"]
+
+
+def test_cached_build_reports_the_same_repairs(tmp_path):
+    source = tmp_path / "source.py"
+    source.write_text(SOURCE.split("\n\ndef build_broken")[0].replace("Assess first.", "Assess first â€” always."))
+
+    def repaired(cache):
+        start = len(DEFAULT_REPAIRER.repairs)
+        parse_question_bank(source, cache)
+        return [(repair.record, repair.after) for repair in DEFAULT_REPAIRER.repairs[start:]]
+
+    uncached = repaired(None)
+    cold = SectionCache(tmp_path / "cache")
+    assert repaired(cold) == uncached
+    cold.save()
+    warm = SectionCache(tmp_path / "cache")
+    assert repaired(warm) == uncached == [("pharm-easy-first", "Assess first — always.")]
+    assert (warm.hits, warm.misses) == (2, 0)
@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+from bulk_ingest import QuizIndex, ingest, validate_row
+
+ROW = {
+    "quiz": "quiz-a",
+    "id": "NEW-1",
+    "text": "Which action comes first?",
+    "options": ["Assess", "Document"],
+    "correctIndex": 0,
+    "explanation": "Assess first.",
+}
+
+
+def nested_bank():
+    return {"quizzes": [{"id": "quiz-a", "title": "A", "questions": [{**ROW, "id": "OLD-1"}]}]}
+
+
+def refs_bank():
+    return {
+        "questions": [{**ROW, "id": "OLD-1"}],
+        "quizzes": [{"id": "quiz-a", "title": "A", "questionIds": ["OLD-1"]}],
+    }
+
+
+def write(path, data):
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("record", [[1, 2], "text", 3, None])
+def test_non_object_ndjson_line_is_an_invalid_row(tmp_path, record):
+    bank = write(tmp_path / "bank.json", nested_bank())
+    before = bank.read_bytes()
+    batch = tmp_path / "batch.ndjson"
+    batch.write_text(json.dumps(ROW) + "\n" + json.dumps(record) + "\n", encoding="utf-8")
+
+    result = ingest([batch], [bank])
+
+    assert [(error.line, error.message) for error in result.errors] == [
+        (2, f"expected a JSON object, found {type(record).__name__}")
+    ]
+    assert not result.written
+    assert bank.read_bytes() == before
+
+
+def test_skip_invalid_writes_the_object_rows(tmp_path):
+    bank = write(tmp_path / "bank.json", nested_bank())
+    batch = tmp_path / "batch.ndjson"
+    batch.write_text("[1, 2]\n" + json.dumps(ROW) + "\n", encoding="utf-8")
+
+    result = ingest([batch], [bank], skip_invalid=True)
+
+    assert len(result.errors) == 1
+    assert result.added == {"quiz-a": 1}
+    ids = [question["id"] for question in json.loads(bank.read_text())["quizzes"][0]["questions"]]
+    assert ids == ["OLD-1", "NEW-1"]
+
+
+def test_validate_row_rejects_non_objects():
+    assert validate_row([1, 2]) == "expected an object, found list"
+    assert validate_row(ROW) is None
+
+
+def test_refs_bank_gets_table_entry_and_question_id(tmp_path):
+    bank = write(tmp_path / "refs.json", refs_bank())
+    batch = tmp_path / "batch.ndjson"
+    batch.write_text(json.dumps(ROW) + "\n" + json.dumps({**ROW, "id": "OLD-1"}) + "\n", encoding="utf-8")
+
+    result = ingest([batch], [bank])
+
+    assert (result.added, result.duplicates) == ({"quiz-a": 1}, 1)
+    data = json.loads(bank.read_text())
+    assert [question["id"] for question in data["questions"]] == ["OLD-1", "NEW-1"]
+    assert data["quizzes"][0]["questionIds"] == ["OLD-1", "NEW-1"]
+    assert QuizIndex([bank]).question_count("quiz-a") == 2
@@ -0,0 +1,41 @@
+import pytest
+
+from dedupe_index import DedupeIndex, iter_keyed_questions, normalized_stem
+
+QUESTION = {"id": "Q-1", "text": "Which action first?", "options": ["A", "B"], "correctIndex": 0}
+OTHER = {"id": "Q-2", "text": "Which finding is expected?", "options": ["A", "B"], "correctIndex": 1}
+
+
+def test_nested_bank_yields_a_question_listed_in_two_quizzes_once():
+    bank = {
+        "quizzes": [
+            {"id": "comprehensive", "questions": [QUESTION, OTHER]},
+            {"id": "category", "questions": [QUESTION]},
+        ]
+    }
+    assert [key for key, _ in iter_keyed_questions(bank)] == ["Q-1", "Q-2"]
+
+
+def test_refs_bank_reads_the_question_table():
+    bank = {
+        "questions": [QUESTION, OTHER],
+        "quizzes": [{"id": "comprehensive", "questionIds": ["Q-1", "Q-2"]}, {"id": "category", "questionIds": ["Q-1"]}],
+    }
+    assert [key for key, _ in iter_keyed_questions(bank)] == ["Q-1", "Q-2"]
+
+
+@pytest.mark.parametrize("data", [[], {"items": []}, {"quizzes": [{"id": "q"}]}])
+def test_unknown_layouts_raise(data):
+    with pytest.raises(ValueError):
+        list(iter_keyed_questions(data))
+
+
+def test_stem_ignores_case_tags_cues_whitespace_and_case():
+    assert normalized_stem("Case 012. Saunders cue: airway first.  Which  action FIRST?") == "which action first?"
+
+
+def test_build_records_only_real_duplicates(tmp_path):
+    retagged = {**OTHER, "id": "Q-3", "text": "Case 7. " + OTHER["text"]}
+    bank = {"quizzes": [{"id": "a", "questions": [QUESTION, OTHER]}, {"id": "b", "questions": [QUESTION, retagged]}]}
+    index = DedupeIndex.build(tmp_path / "bank.json", bank, cache_dir=tmp_path)
+    assert index.duplicates == [("Q-3", "Q-2")]
@@ -0,0 +1,14 @@
+from mojibake import MojibakeRepairer
+
+
+def test_only_the_mojibake_runs_are_redecoded():
+    repairer = MojibakeRepairer()
+    assert repairer.repair("Café: 38Â°C â€¢ monitor", "Q-1") == "Café: 38°C • monitor"
+    assert [(repair.record, repair.after) for repair in repairer.repairs] == [("Q-1", "Café: 38°C • monitor")]
+
+
+def test_text_without_mojibake_is_returned_unchanged():
+    repairer = MojibakeRepairer()
+    for value in ("plain ascii", "Café – naïve 0.5°C"):
+        assert repairer.repair(value) is value
+    assert repairer.repairs == []
@@ -0,0 +1,41 @@
+import json
+
+from near_duplicates import detect, load_questions
+
+
+def question(qid, patient):
+    return {
+        "id": qid,
+        "text": f"A client, {patient} (a 25-year-old trauma patient with rib fractures), asks the nurse in a trauma "
+        "bay about pain control before coughing exercises. Which response by the nurse is most appropriate?",
+        "options": ["Splint the chest with a pillow", "Avoid coughing", "Lie flat", "Hold all analgesics"],
+        "correctIndex": 0,
+    }
+
+
+def write_nested_bank(path, *questions):
+    # Like the generated NCLEX banks: every question sits in the comprehensive
+    # quiz and again in its category quiz.
+    path.write_text(
+        json.dumps({"quizzes": [
+            {"id": "quiz-nclex-comprehensive", "questions": list(questions)},
+            {"id": "quiz-nclex-category", "questions": list(questions)},
+        ]}),
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_question_repeated_across_quizzes_is_not_a_near_duplicate(tmp_path):
+    bank = write_nested_bank(tmp_path / "bank.json", question("Q-1", "Mr. Alvarez"))
+    loaded = load_questions([bank, bank])
+    assert [entry.key for entry, _ in loaded] == ["Q-1"]
+    assert detect(loaded).clusters == []
+
+
+def test_template_copies_with_another_patient_cluster(tmp_path):
+    bank = write_nested_bank(
+        tmp_path / "bank.json", question("Q-1", "Mr. Alvarez"), question("Q-2", "Ms. Rodriguez")
+    )
+    result = detect(load_questions([bank]))
+    assert [[member.key for member in cluster.members] for cluster in result.clusters] == [["Q-1", "Q-2"]]
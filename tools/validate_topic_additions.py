@@ -8,6 +8,8 @@ For each candidate question the validation checks:
 - options exist and length >= 2
 - correctIndex present and in-range
 - whether the explanation contains the correct option text (substring check) — if not, flag as suspected mismatch
+- whether an earlier question in the same file has the same normalized stem (via the
+  persistent `dedupe_index`) — if so, flag as a duplicate
 
 The script prints a summary and writes a report file `tools/validation_report.json`.
 """
@@ -15,6 +17,9 @@ import json
 from pathlib import Path
 from collections import defaultdict
 
+from bank_encoders import write_encoded
+from dedupe_index import DedupeIndex, question_key
+
 ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = ROOT / "assets" / "data"
 
@@ -85,6 +90,8 @@ def main():
             print(f"Warning: {path} not found, skipping")
             continue
         data = load_json(path)
+        index = DedupeIndex.load(path, data)
+        quizzes = data.get('quizzes') or []
         candidates = find_candidates(data)
         total_candidates += len(candidates)
         file_report = {
@@ -94,6 +101,10 @@ def main():
         }
         for qi, qj, q in candidates:
             probs = validate_question(q)
+            first = index.find(q.get('text') or '')
+            duplicate_of = first if first != question_key(quizzes[qi], qi, qj, q) else None
+            if duplicate_of is not None:
+                probs.append('duplicate-stem')
             if probs:
                 total_problems += 1
                 item = {
@@ -105,6 +116,8 @@ def main():
                     'correctIndex': q.get('correctIndex'),
                     'explanation_snippet': ((q.get('explanation') or '')[:200])
                 }
+                if duplicate_of is not None:
+                    item['duplicate_of'] = duplicate_of
                 file_report['problems'].append(item)
 
         report['files'][str(path.name)] = file_report
@@ -115,8 +128,7 @@ def main():
     }
 
     outpath = Path(__file__).resolve().parent / 'validation_report.json'
-    with open(outpath, 'w', encoding='utf-8') as f:
-        json.dump(report, f, ensure_ascii=False, indent=2)
+    write_encoded(outpath, report, ensure_ascii=False)
 
     print(f"Validation complete. {total_candidates} candidate questions scanned, {total_problems} with potential problems.")
     print(f"Report written to {outpath}")